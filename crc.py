@@ -2,7 +2,12 @@
 
 import argparse
 import ast
+import atexit
+import logging
 import os
+import queue
+import re
+import threading
 from typing import Dict, List, Union
 
 from influxdb_client import InfluxDBClient, Point
@@ -44,8 +49,27 @@ class CRC:
     """
     Class for cleaning up resources across different clouds.
     This also supports sending notification to Slack Channels
+
+    Notifications are sent by a background thread, close() must be called to wait for the
+    queued ones to be sent. Using the object as a context manager does so on exit, and any
+    object still open when the interpreter exits is closed then.
     """
 
+    __slots__ = (
+        "cloud",
+        "dry_run",
+        "project_id",
+        "notags",
+        "slack_client",
+        "influxdb_client",
+        "slack_channel",
+        "resource_group",
+        "influxdb_bucket",
+        "resource_suffix",
+        "_notifications",
+        "_notification_worker",
+    )
+
     def __init__(
         self,
         cloud: str,
@@ -87,6 +111,91 @@ class CRC:
             self.influxdb_bucket = influxdb_conn.get("bucket")
             self.resource_suffix = influxdb_conn.get("resource_suffix")
 
+        # Slack and InfluxDB calls are made by a background thread, so they don't
+        # hold up the cleanup operations.
+        self._notifications = queue.Queue()
+        self._notification_worker = None
+        if slack_client or influxdb_client:
+            self._notification_worker = threading.Thread(
+                target=self._process_notifications, daemon=True
+            )
+            self._notification_worker.start()
+            # The worker is a daemon thread, flush it at exit if close() was not called
+            atexit.register(self.close)
+
+    def __enter__(self) -> "CRC":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _notify_slack(self, channel: str, text: str, link_names: bool = False):
+        """
+        Queue a message to be posted on Slack by the notification worker.
+
+        :param channel: The Slack channel (or conversation id) to post to.
+        :param text: The message to post.
+        :param link_names: Whether Slack should link the user and group names in the message.
+        """
+        self._notifications.put(("slack", channel, text, link_names))
+
+    def _post_on_slack(self, channel: str, text: str, link_names: bool):
+        """
+        Post a message on Slack.
+
+        :param channel: The Slack channel (or conversation id) to post to.
+        :param text: The message to post.
+        :param link_names: Whether Slack should link the user and group names in the message.
+        """
+        try:
+            if link_names:
+                self.slack_client.chat_postMessage(
+                    channel=channel, text=text, link_names=True
+                )
+            else:
+                self.slack_client.chat_postMessage(channel=channel, text=text)
+        except Exception as e:
+            logging.error(
+                f"Failed to send message '{text}' to Slack channel '{channel}': {e}"
+            )
+
+    def _write_point(self, point: Point):
+        """
+        Write a single Point to the InfluxDB bucket.
+
+        :param point: The Point to write.
+        """
+        try:
+            # Get the write API object from the InfluxDB client, with synchronous write options
+            write_api = self.influxdb_client.write_api(write_options=SYNCHRONOUS)
+            write_api.write(bucket=self.influxdb_bucket, record=point)
+        except Exception as e:
+            logging.error(f"Unable to push data to influxDB: {e}")
+
+    def _process_notifications(self):
+        """
+        Body of the notification worker thread.
+        Sends queued Slack messages and InfluxDB points, in order, until the stop sentinel (None) is received.
+        """
+        while True:
+            item = self._notifications.get()
+            if item is None:
+                return
+            if item[0] == "slack":
+                self._post_on_slack(*item[1:])
+            elif item[0] == "influxdb":
+                self._write_point(item[1])
+
+    def close(self):
+        """
+        Wait for all queued notifications to be sent and stop the notification worker.
+        """
+        if self._notification_worker:
+            self._notifications.put(None)
+            self._notification_worker.join()
+            self._notification_worker = None
+            atexit.unregister(self.close)
+
     def _delete_vm(self, vm, instance_state: List[str]):
         """
         Delete the specified vm.
@@ -253,16 +362,7 @@ class CRC:
                         + f"`{operated_list_length}` {self.cloud} {resource}(s):\n<!subteam^{member_id}> disks `{operated_list[key]}`\n\n"
                     )
 
-                try:
-                    self.slack_client.chat_postMessage(
-                        channel="#" + self.slack_channel,
-                        text=final_msg,
-                        link_names=True,
-                    )
-                except Exception as e:
-                    print(
-                        f"Failed to send message '{final_msg}' to Slack channel '{self.slack_channel}': {e}"
-                    )
+                self._notify_slack("#" + self.slack_channel, final_msg, link_names=True)
             else:
                 # Individual User
 
@@ -278,15 +378,8 @@ class CRC:
                 )
                 channel_id = response["channel"]["id"]
 
-                try:
-                    # Post Message
-                    self.slack_client.chat_postMessage(
-                        channel=channel_id, text=final_msg, link_names=True
-                    )
-                except Exception as e:
-                    print(
-                        f"Failed to send message '{final_msg}' to Slack channel '{channel_id}': {e}"
-                    )
+                # Post Message
+                self._notify_slack(channel_id, final_msg, link_names=True)
 
     def get_msg(self, resource: str, operation_type: str, operated_list: list) -> str:
         """
@@ -316,14 +409,7 @@ class CRC:
         :type nic: object
         """
         msg = self.get_msg(NICS, DELETED, nic.get_deleted_nic)
-        try:
-            self.slack_client.chat_postMessage(
-                channel="#" + self.slack_channel, text=msg
-            )
-        except Exception as e:
-            print(
-                f"Failed to send message '{msg}' to Slack channel '{self.slack_channel}': {e}"
-            )
+        self._notify_slack("#" + self.slack_channel, msg)
 
     def notify_deleted_vm_via_slack(self, vm: object):
         """
@@ -333,14 +419,7 @@ class CRC:
         :type vm: object
         """
         msg = self.get_msg(VMS, DELETED, vm.get_deleted)
-        try:
-            self.slack_client.chat_postMessage(
-                channel="#" + self.slack_channel, text=msg
-            )
-        except Exception as e:
-            print(
-                f"Failed to send message '{msg}' to Slack channel '{self.slack_channel}': {e}"
-            )
+        self._notify_slack("#" + self.slack_channel, msg)
 
         if self.cloud == "azure":
             self.notify_deleted_nic_via_slack(vm)
@@ -353,14 +432,7 @@ class CRC:
         :type vm: object
         """
         msg = self.get_msg(VMS, STOPPED, vm.get_stopped)
-        try:
-            self.slack_client.chat_postMessage(
-                channel="#" + self.slack_channel, text=msg
-            )
-        except Exception as e:
-            print(
-                f"Failed to send message '{msg}' to Slack channel '{self.slack_channel}': {e}"
-            )
+        self._notify_slack("#" + self.slack_channel, msg)
 
     def notify_deleted_spot_request_via_slack(self, spot_instance_request: object):
         """
@@ -372,14 +444,7 @@ class CRC:
         msg = self.get_msg(
             SPOT_INSTANCE_REQUEST, DELETED, spot_instance_request.get_deleted
         )
-        try:
-            self.slack_client.chat_postMessage(
-                channel="#" + self.slack_channel, text=msg
-            )
-        except Exception as e:
-            print(
-                f"Failed to send message '{msg}' to Slack channel '{self.slack_channel}': {e}"
-            )
+        self._notify_slack("#" + self.slack_channel, msg)
 
     def notify_deleted_ip_via_slack(self, ip: object):
         """
@@ -389,14 +454,7 @@ class CRC:
         ip (object): the deleted IP instance
         """
         msg = self.get_msg(IPS, DELETED, ip.get_deleted)
-        try:
-            self.slack_client.chat_postMessage(
-                channel="#" + self.slack_channel, text=msg
-            )
-        except Exception as e:
-            print(
-                f"Failed to send message '{msg}' to Slack channel '{self.slack_channel}': {e}"
-            )
+        self._notify_slack("#" + self.slack_channel, msg)
 
     def notify_deleted_keypair_via_slack(self, keypair: object):
         """
@@ -406,14 +464,7 @@ class CRC:
         :type vm: object
         """
         msg = self.get_msg(KEYPAIRS, DELETED, keypair.get_deleted)
-        try:
-            self.slack_client.chat_postMessage(
-                channel="#" + self.slack_channel, text=msg
-            )
-        except Exception as e:
-            print(
-                f"Failed to send message '{msg}' to Slack channel '{self.slack_channel}': {e}"
-            )
+        self._notify_slack("#" + self.slack_channel, msg)
 
     def notify_deleted_nic_via_slack(self, nic: object):
         """
@@ -423,14 +474,7 @@ class CRC:
         :type vm: object
         """
         msg = self.get_msg(NICS, DELETED, nic.get_deleted)
-        try:
-            self.slack_client.chat_postMessage(
-                channel="#" + self.slack_channel, text=msg
-            )
-        except Exception as e:
-            print(
-                f"Failed to send message '{msg}' to Slack channel '{self.slack_channel}': {e}"
-            )
+        self._notify_slack("#" + self.slack_channel, msg)
 
     def notify_deleted_disk_via_slack(self, disk: object):
         """
@@ -442,14 +486,7 @@ class CRC:
         if type(disk.get_deleted) == list:
             # Send a one single message into the channel
             msg = self.get_msg(DISKS, DELETED, disk.get_deleted)
-            try:
-                self.slack_client.chat_postMessage(
-                    channel="#" + self.slack_channel, text=msg, link_names=True
-                )
-            except Exception as e:
-                print(
-                    f"Failed to send message '{msg}' to Slack channel '{self.slack_channel}': {e}"
-                )
+            self._notify_slack("#" + self.slack_channel, msg, link_names=True)
         elif type(disk.get_deleted) == dict:
             # Directly ping the individuals 1:1 and groups/untagged into channel
             self.ping_on_slack(DISKS, DELETED, disk.get_deleted)
@@ -462,14 +499,7 @@ class CRC:
         :type vm: object
         """
         msg = self.get_msg(KMS, DELETED, kms.get_deleted)
-        try:
-            self.slack_client.chat_postMessage(
-                channel="#" + self.slack_channel, text=msg
-            )
-        except Exception as e:
-            print(
-                f"Failed to send message '{msg}' to Slack channel '{self.slack_channel}': {e}"
-            )
+        self._notify_slack("#" + self.slack_channel, msg)
 
     def write_influxdb(self, resource_name: str, resources: List[str]) -> None:
         """
@@ -479,26 +509,20 @@ class CRC:
             resource_name (str): The name of the resource being written to InfluxDB.
             resources (List[str]): A list of resources to be written to InfluxDB.
         """
-        try:
-            # Get the write API object from the InfluxDB client, with synchronous write options
-            write_api = self.influxdb_client.write_api(write_options=SYNCHRONOUS)
-
-            if self.resource_suffix:
-                resource_name = resource_name + "_" + self.resource_suffix
+        if self.resource_suffix:
+            resource_name = resource_name + "_" + self.resource_suffix
+
+        # Create a Point object with the resource name, tags for the names of the resources,
+        # and a field for the count of resources
+        point = (
+            Point(self.cloud)
+            .tag("resource", resource_name)
+            .field("names", str(resources))
+            .field("count", len(resources))
+        )
 
-            # Create a Point object with the resource name, tags for the names of the resources,
-            # and a field for the count of resources
-            point = (
-                Point(self.cloud)
-                .tag("resource", resource_name)
-                .field("names", str(resources))
-                .field("count", len(resources))
-            )
-
-            # Write the Point object to the InfluxDB bucket
-            write_api.write(bucket=self.influxdb_bucket, record=point)
-        except Exception as e:
-            print(f"Unable to push data to influxDB: {e}")
+        # The Point is written to the InfluxDB bucket by the notification worker
+        self._notifications.put(("influxdb", point))
 
     def delete_vm(
         self,
@@ -783,6 +807,77 @@ class CRC:
             self.write_influxdb(KMS, kms.get_deleted)
 
 
+def _operate_vm(crc: CRC, args: dict):
+    """
+    Delete or stop virtual machines depending on the requested operation type.
+
+    :param crc: The CRC object bound to the cloud being processed.
+    :param args: The parsed command line arguments.
+    """
+    if args.get("operation_type") == "stop":
+        crc.stop_vm(
+            args.get("filter_tags"),
+            args.get("exception_tags"),
+            args.get("age"),
+            args.get("custom_age_tag_key"),
+        )
+    else:
+        crc.delete_vm(
+            args.get("filter_tags"),
+            args.get("exception_tags"),
+            args.get("age"),
+            args.get("custom_age_tag_key"),
+            args.get("resource_states"),
+        )
+
+
+# Mapping of resource name to the CRC operation handling it
+RESOURCE_HANDLERS = {
+    "disk": lambda crc, args: crc.delete_disks(
+        args.get("filter_tags"),
+        args.get("exception_tags"),
+        args.get("age"),
+        args.get("custom_age_tag_key"),
+        args.get("detach_age"),
+        args.get("name_regex"),
+        args.get("exception_regex"),
+        args.get("slack_notify_users"),
+        args.get("slack_user_label"),
+    ),
+    "ip": lambda crc, args: crc.delete_ip(
+        args.get("filter_tags"),
+        args.get("exception_tags"),
+        args.get("name_regex"),
+        args.get("exception_regex"),
+    ),
+    "keypair": lambda crc, args: crc.delete_keypairs(
+        args.get("name_regex"), args.get("exception_regex"), args.get("age")
+    ),
+    "nic": lambda crc, args: crc.delete_nic(
+        args.get("name_regex"), args.get("exception_regex")
+    ),
+    "vm": _operate_vm,
+    "vpc": lambda crc, args: crc.delete_vpc(
+        args.get("filter_tags"), args.get("exception_tags")
+    ),
+    "kms": lambda crc, args: crc.delete_kms(
+        args.get("filter_tags"),
+        args.get("exception_tags"),
+        args.get("kms_key_description"),
+        args.get("kms_user"),
+        args.get("kms_pending_window"),
+        args.get("age"),
+        args.get("custom_age_tag_key"),
+    ),
+    "spot_instance_requests": lambda crc, args: crc.delete_spot_instance_requests(
+        args.get("filter_tags"),
+        args.get("exception_tags"),
+        args.get("age"),
+        args.get("custom_age_tag_key"),
+    ),
+}
+
+
 def get_argparser():
     """
     Method to parse and return command line arguments.
@@ -1055,6 +1150,22 @@ def are_values_of_dict_lists(name: str, value):
             is_valid_list(f"Value of {name} with key {key}", val)
 
 
+def is_valid_regex_list(name: str, value):
+    """
+    Check if the given value is a list of valid regular expressions and raises a ValueError if it is not.
+    :param name: name of the variable being checked
+    :param value: the value of the variable being checked
+    """
+    is_valid_list(name, value)
+    for pattern in value or []:
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(
+                f"{name} contains an invalid regular expression {pattern!r}: {e}"
+            )
+
+
 def _validate_influxdb_input(influxdb: dict, field: str):
     """
     Validates a required field in the InfluxDB input.
@@ -1104,7 +1215,6 @@ def main():
     name_regex = args.get("name_regex")
     exception_regex = args.get("exception_regex")
     age = args.get("age")
-    custom_age_tag_key = args.get("custom_age_tag_key")
     max_age = args.get("max_age")
     detach_age = args.get("detach_age")
     dry_run = args.get("dry_run")
@@ -1113,7 +1223,6 @@ def main():
     slack_notify_users = args.get("slack_notify_users")
     slack_user_label = args.get("slack_user_label")
     influxdb = args.get("influxdb")
-    kms_pending_window = args.get("kms_pending_window")
     kms_key_description = args.get("kms_key_description")
     kms_user = args.get("kms_user")
     resource_group = args.get("resource_group")
@@ -1167,6 +1276,13 @@ def main():
     are_values_of_dict_lists("exception_tags", exception_tags)
     is_valid_list("name_regex", name_regex)
     is_valid_list("exception_regex", exception_regex)
+    # Only AWS keypairs and GCP disks treat these values as regular expressions,
+    # GCP IPs and Azure NICs match them as plain substrings
+    if "aws" in clouds and "keypair" in resources:
+        is_valid_regex_list("name_regex", name_regex)
+        is_valid_regex_list("exception_regex", exception_regex)
+    if "gcp" in clouds and "disk" in resources:
+        is_valid_regex_list("exception_regex", exception_regex)
     is_valid_dict("age", age)
     is_valid_dict("detach_age", detach_age)
     is_valid_dict("influxdb", influxdb)
@@ -1188,7 +1304,7 @@ def main():
 
     # Perform operations
     for cloud in clouds:
-        crc = CRC(
+        with CRC(
             cloud,
             dry_run,
             notags,
@@ -1198,58 +1314,9 @@ def main():
             resource_group,
             slack_channel,
             influxdb,
-        )
-        for resource in resources:
-            if resource == "disk":
-                crc.delete_disks(
-                    filter_tags,
-                    exception_tags,
-                    age,
-                    custom_age_tag_key,
-                    detach_age,
-                    name_regex,
-                    exception_regex,
-                    slack_notify_users,
-                    slack_user_label,
-                )
-            elif resource == "ip":
-                crc.delete_ip(
-                    filter_tags,
-                    exception_tags,
-                    name_regex,
-                    exception_regex,
-                )
-            elif resource == "keypair":
-                crc.delete_keypairs(name_regex, exception_regex, age)
-            elif resource == "nic":
-                crc.delete_nic(name_regex, exception_regex)
-            elif resource == "vm":
-                if operation_type == "delete":
-                    crc.delete_vm(
-                        filter_tags,
-                        exception_tags,
-                        age,
-                        custom_age_tag_key,
-                        resource_states,
-                    )
-                elif operation_type == "stop":
-                    crc.stop_vm(filter_tags, exception_tags, age, custom_age_tag_key)
-            elif resource == "vpc":
-                crc.delete_vpc(filter_tags, exception_tags)
-            elif resource == "kms":
-                crc.delete_kms(
-                    filter_tags,
-                    exception_tags,
-                    kms_key_description,
-                    kms_user,
-                    kms_pending_window,
-                    age,
-                    custom_age_tag_key,
-                )
-            elif resource == "spot_instance_requests":
-                crc.delete_spot_instance_requests(
-                    filter_tags, exception_tags, age, custom_age_tag_key
-                )
+        ) as crc:
+            for resource in resources:
+                RESOURCE_HANDLERS[resource](crc, args)
     if max_age:
         del os.environ["MAX_AGE"]
         print("MAX_AGE reset.")
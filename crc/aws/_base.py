@@ -1,18 +1,264 @@
 # Copyright (c) Yugabyte, Inc.
 
+import functools
+import json
 import logging
-from typing import List
-
-import boto3
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 """
 This module contains a function to get all available regions on AWS for a specific service.
 """
 
+# File where the list of regions is cached between runs
+REGIONS_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "crc", "regions.json"
+)
+
+# Number of seconds the cached list of regions stays valid
+REGIONS_CACHE_TTL = 24 * 3600
+
+# Number of regions scanned concurrently
+REGION_WORKERS = 16
+
+# Number of delete calls issued concurrently
+DELETE_WORKERS = 10
+
+# Size of the HTTP connection pool of each client, large enough for every
+# thread of the pools above to have a request in flight
+MAX_POOL_CONNECTIONS = 32
+
+# Maximum number of tag filters sent with a single describe call
+MAX_TAG_FILTERS = 10
+
+# Serializes client creation, as a boto3 session is not thread safe
+_session_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_client_config():
+    """
+    Returns the botocore config for clients which are called from several threads at once.
+    Adaptive retries back off client side when AWS starts throttling the parallel calls.
+
+    :return: botocore client config
+    :rtype: botocore.config.Config
+    """
+    from botocore.config import Config
+
+    return Config(
+        retries={"max_attempts": 10, "mode": "adaptive"},
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_session():
+    """
+    Returns the boto3 session shared by all clients, so credentials and endpoints are only resolved once.
+
+    :return: boto3 session
+    :rtype: boto3.Session
+    """
+    # boto3 is imported on first use so that runs against other clouds don't pay
+    # for loading botocore's service data.
+    import boto3
+
+    return boto3.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(service_name: str, region_name: str):
+    """
+    Returns a boto3 client for the given service and region.
+    Building a client loads and parses the service model, so clients are cached
+    and reused for the whole run instead of being created in every loop.
+
+    :param service_name: The name of the service, such as 'ec2' or 's3'
+    :type service_name: str
+    :param region_name: The region the client talks to
+    :type region_name: str
+    :return: boto3 client
+    """
+    with _session_lock:
+        return get_session().client(
+            service_name, region_name=region_name, config=get_client_config()
+        )
+
+
+def get_resource(service_name: str, region_name: str):
+    """
+    Returns a boto3 resource for the given service and region.
+    Unlike clients, resources are not thread safe, so a new one is built on every call
+    and must only be used by the thread which asked for it.
+
+    :param service_name: The name of the service, such as 'ec2' or 's3'
+    :type service_name: str
+    :param region_name: The region the resource talks to
+    :type region_name: str
+    :return: boto3 resource
+    """
+    with _session_lock:
+        return get_session().resource(
+            service_name, region_name=region_name, config=get_client_config()
+        )
+
 
+def get_tag_filters(filter_tags: Dict[str, List[str]]) -> List[Dict[str, List[str]]]:
+    """
+    Translates filter tags into EC2 describe filters.
+
+    :param filter_tags: dictionary containing key-value pairs as filter tags
+    :type filter_tags: Dict[str, List[str]]
+    :return: list of filters, one per tag key.
+    :rtype: List[Dict[str, List[str]]]
+    """
+    return [
+        {"Name": f"tag:{key}", "Values": value}
+        for key, value in (filter_tags or {}).items()
+    ]
+
+
+def describe_all(
+    client,
+    operation_name: str,
+    filters: List[Dict[str, List[str]]],
+    get_items: Callable[[dict], Iterable[dict]],
+    id_key: str,
+) -> List[dict]:
+    """
+    Calls a paginated EC2 describe operation and returns the items of all the pages.
+    EC2 doesn't return results when a call carries too many tag filters, so with more than
+    MAX_TAG_FILTERS of them the tag filters are split into groups, each group is described
+    separately and only the items returned for every group are kept, as filters are ANDed.
+
+    :param client: EC2 client
+    :param operation_name: name of the describe operation, such as 'describe_instances'
+    :type operation_name: str
+    :param filters: filters of the describe operation
+    :type filters: List[Dict[str, List[str]]]
+    :param get_items: returns the items of a response page
+    :type get_items: Callable[[dict], Iterable[dict]]
+    :param id_key: key identifying an item, used to intersect the groups
+    :type id_key: str
+    :return: items matching all the filters
+    :rtype: List[dict]
+    """
+    paginator = client.get_paginator(operation_name)
+    tag_filters = [f for f in filters if f["Name"].startswith("tag:")]
+    if len(tag_filters) <= MAX_TAG_FILTERS:
+        items = []
+        for page in paginator.paginate(Filters=filters):
+            items.extend(get_items(page))
+        return items
+
+    other_filters = [f for f in filters if not f["Name"].startswith("tag:")]
+    matching = None
+    for start in range(0, len(tag_filters), MAX_TAG_FILTERS):
+        group_filters = other_filters + tag_filters[start : start + MAX_TAG_FILTERS]
+        group_items = {}
+        for page in paginator.paginate(Filters=group_filters):
+            for item in get_items(page):
+                if matching is None or item[id_key] in matching:
+                    group_items[item[id_key]] = item
+        matching = group_items
+    return list(matching.values())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_account_scope(region_name: str) -> Tuple[Optional[str], str]:
+    """
+    Returns the account and partition the credentials of the run belong to.
+    The regions enabled differ between accounts and partitions (aws, aws-cn, aws-us-gov),
+    so the cached lists of regions are kept apart for each of them.
+    Looking up the account needs the sts:GetCallerIdentity permission, without it only the
+    partition is returned.
+
+    :param region_name: The region used to look up the account and its partition
+    :type region_name: str
+    :return: the account ID, None if it can't be looked up, and the partition name
+    :rtype: Tuple[Optional[str], str]
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    with _session_lock:
+        partition = get_session().get_partition_for_region(region_name)
+    try:
+        account = get_client("sts", region_name).get_caller_identity()["Account"]
+    except (BotoCoreError, ClientError) as e:
+        logging.warning(
+            f"Unable to look up the AWS account, regions are cached for the {partition} partition only: {e}"
+        )
+        account = None
+    return account, partition
+
+
+def _read_cached_regions(scope: str, service_name: str) -> List[str]:
+    """
+    Returns the cached list of regions for the given account scope and service if the cache entry is still fresh.
+
+    :param scope: account and partition the regions were listed for, such as '123456789012:aws',
+        or only the partition when the account is unknown
+    :type scope: str
+    :param service_name: The name of the service, such as 'ec2' or 's3'
+    :type service_name: str
+    :return: cached list of regions, None if there is no valid cache entry
+    :rtype: List[str]
+    """
+    try:
+        with open(REGIONS_CACHE_FILE) as cache_file:
+            entry = json.load(cache_file)[scope][service_name]
+        if time.time() - entry["timestamp"] >= REGIONS_CACHE_TTL:
+            return None
+        return list(entry["regions"])
+    except (KeyError, TypeError) as e:
+        logging.debug(f"No cached regions for {service_name} in {scope}: {e}")
+    except (OSError, ValueError) as e:
+        logging.debug(f"Unable to read regions cache {REGIONS_CACHE_FILE}: {e}")
+    return None
+
+
+def _write_cached_regions(scope: str, service_name: str, regions: List[str]) -> None:
+    """
+    Stores the list of regions for the given account scope and service in the cache file.
+
+    :param scope: account and partition the regions were listed for, such as '123456789012:aws',
+        or only the partition when the account is unknown
+    :type scope: str
+    :param service_name: The name of the service, such as 'ec2' or 's3'
+    :type service_name: str
+    :param regions: list of regions available for the given service
+    :type regions: List[str]
+    """
+    try:
+        cached = {}
+        if os.path.exists(REGIONS_CACHE_FILE):
+            with open(REGIONS_CACHE_FILE) as cache_file:
+                cached = json.load(cache_file)
+    except (OSError, ValueError):
+        cached = {}
+    if not isinstance(cached, dict):
+        cached = {}
+    if not isinstance(cached.get(scope), dict):
+        cached[scope] = {}
+
+    cached[scope][service_name] = {"timestamp": time.time(), "regions": regions}
+    try:
+        os.makedirs(os.path.dirname(REGIONS_CACHE_FILE), exist_ok=True)
+        with open(REGIONS_CACHE_FILE, "w") as cache_file:
+            json.dump(cached, cache_file)
+    except OSError as e:
+        logging.warning(f"Unable to write regions cache {REGIONS_CACHE_FILE}: {e}")
+
+
+@functools.lru_cache(maxsize=None)
 def get_all_regions(service_name: str, default_region_name: str) -> List[str]:
     """
-    Returns a list of all regions available on AWS for a given service.
+    Returns a list of all regions enabled for the account, as listed by the service's describe_regions call.
+    The list is cached on disk for REGIONS_CACHE_TTL seconds per account and partition, as it rarely
+    changes, and in memory for the rest of the run.
 
     :param service_name: The name of the service, such as 'ec2' or 's3'
     :type service_name: str
@@ -21,7 +267,21 @@ def get_all_regions(service_name: str, default_region_name: str) -> List[str]:
     :return: list of regions available for the given service
     :rtype: List[str]
     """
-    client = boto3.client(service_name, region_name=default_region_name)
-    regions = [region["RegionName"] for region in client.describe_regions()["Regions"]]
+    account, partition = _get_account_scope(default_region_name)
+    scope = f"{account}:{partition}" if account else partition
+    regions = _read_cached_regions(scope, service_name)
+    if regions:
+        logging.info(f"Retrieved list of regions from cache: {regions}")
+        return regions
+
+    client = get_client(service_name, default_region_name)
+    # Without AllRegions, describe_regions leaves out the regions the account hasn't opted into.
+    # The enabled regions are not filtered further with botocore's static endpoint data, which
+    # would silently drop the regions released after the installed botocore.
+    regions = [
+        region["RegionName"]
+        for region in client.describe_regions(AllRegions=False)["Regions"]
+    ]
     logging.info(f"Retrieved list of regions: {regions}")
+    _write_cached_regions(scope, service_name, regions)
     return regions
@@ -1,12 +1,12 @@
 # Copyright (c) Yugabyte, Inc.
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List
 
-import boto3
-
-from crc.aws._base import get_all_regions
+from crc.aws._base import DELETE_WORKERS, REGION_WORKERS, get_all_regions, get_client
 from crc.service import Service
+from crc.utils import freeze_tag_values, split_tag_filter
 
 
 class ElasticIPs(Service):
@@ -30,6 +30,19 @@ class ElasticIPs(Service):
     When initializing the class, the user can pass in a dry_run boolean value, as well as dictionaries for filter_tags, exception_tags, and notags. These parameters will be used to determine which Elastic IPs to delete.
     """
 
+    __slots__ = (
+        "deleted_ips",
+        "dry_run",
+        "filter_tags",
+        "exception_tags",
+        "notags",
+        "_filter_pairs",
+        "_filter_keys",
+        "_exception_pairs",
+        "_exception_keys",
+        "_notag_values",
+    )
+
     service_name = "ec2"
     """
     The service_name variable specifies the AWS service that this class will interact with.
@@ -58,6 +71,9 @@ class ElasticIPs(Service):
         self.filter_tags = filter_tags
         self.exception_tags = exception_tags
         self.notags = notags
+        self._filter_pairs, self._filter_keys = split_tag_filter(filter_tags)
+        self._exception_pairs, self._exception_keys = split_tag_filter(exception_tags)
+        self._notag_values = freeze_tag_values(notags)
 
     @property
     def get_deleted(self) -> str:
@@ -77,35 +93,118 @@ class ElasticIPs(Service):
         logging.info(f"count of items in deleted_ips: {count}")
         return count
 
-    def _should_skip_instance(self, tags: List[Dict[str, str]]) -> bool:
+    def _should_skip_instance(self, tag_values: Dict[str, str]) -> bool:
         """
         Check if the Elastic IP instance should be skipped based on the exception and notags filter.
-        :param tags: List of tags associated with the Elastic IP instance
-        :type tags: List[Dict[str,str]]
+        :param tag_values: Tags associated with the Elastic IP instance, as a key to value mapping
+        :type tag_values: Dict[str,str]
         :return: True if the Elastic IP instance should be skipped, False otherwise
         :rtype: bool
         """
         if not self.exception_tags and not self.notags:
             return False
-        in_exception_tags = False
-        in_no_tags = False
-        for tag in tags:
-            key = tag["Key"]
-            if self.exception_tags:
-                in_exception_tags = key in self.exception_tags and (
-                    not self.exception_tags[key]
-                    or tag["Value"] in self.exception_tags[key]
-                )
-                if in_exception_tags:
-                    return True
-            if self.notags:
-                in_no_tags = all(
-                    in_no_tags
-                    and key in self.notags
-                    and (not self.notags[key] or tag["Value"] in self.notags[key]),
-                )
 
-        return in_no_tags
+        if self.exception_tags and (
+            tag_values.items() & self._exception_pairs
+            or tag_values.keys() & self._exception_keys
+        ):
+            return True
+
+        if self.notags:
+            return all(
+                key in tag_values and (not values or tag_values[key] in values)
+                for key, values in self._notag_values.items()
+            )
+        return False
+
+    def _get_filter(self) -> List[Dict[str, List[str]]]:
+        """
+        Creates a filter to be used when searching for Elastic IPs, based on the filter tags provided during initialization.
+        Filters on different names are ANDed by EC2, while an EIP matches filter_tags if any of the tags match,
+        so only the tag keys are filtered server side and the values are still checked by _should_delete_eip.
+
+        :return: list of filters.
+        :rtype: List[Dict[str, List[str]]]
+        """
+        filters = []
+        if self.filter_tags:
+            filters.append({"Name": "tag-key", "Values": list(self.filter_tags)})
+
+        logging.info(f"Filters created: {filters}")
+        return filters
+
+    def _should_delete_eip(self, eip: dict, no_filters: bool) -> bool:
+        """
+        Check if the Elastic IP is unattached and matches the filter_tags, exception_tags and notags filter.
+        :param eip: Elastic IP as returned by describe_addresses
+        :type eip: dict
+        :param no_filters: True if no tag based filter is set, in which case every tagged EIP matches
+        :type no_filters: bool
+        :return: True if the Elastic IP should be deleted, False otherwise
+        :rtype: bool
+        """
+        if "NetworkInterfaceId" in eip or "Tags" not in eip:
+            return False
+        if no_filters:
+            return True
+        # Built once per EIP and shared by all the tag checks below
+        tag_values = {tag["Key"]: tag["Value"] for tag in eip["Tags"]}
+        if self._should_skip_instance(tag_values):
+            return False
+        if not self.filter_tags:
+            return True
+        # check for filter_tags match
+        return bool(
+            tag_values.items() & self._filter_pairs
+            or tag_values.keys() & self._filter_keys
+        )
+
+    def _delete_in_region(
+        self,
+        region: str,
+        eip_filter: List[Dict[str, List[str]]],
+        no_filters: bool,
+        executor: ThreadPoolExecutor,
+    ) -> List[str]:
+        """
+        Release the matching Elastic IPs of a single region.
+        Every matching EIP is submitted for release as soon as it is found, so the scan and
+        the release calls overlap instead of running one after the other.
+        :param region: region to clean up
+        :type region: str
+        :param eip_filter: filters passed to describe_addresses
+        :type eip_filter: List[Dict[str, List[str]]]
+        :param no_filters: True if no tag based filter is set, in which case every tagged EIP matches
+        :type no_filters: bool
+        :param executor: executor running the release_address calls
+        :type executor: ThreadPoolExecutor
+        :return: list of Elastic IPs deleted (or to be deleted in dry_run mode)
+        :rtype: List[str]
+        """
+        client = get_client(self.service_name, region)
+        deleted_ips = []
+        futures = {}
+        for eip in client.describe_addresses(Filters=eip_filter)["Addresses"]:
+            if not self._should_delete_eip(eip, no_filters):
+                continue
+            if self.dry_run:
+                deleted_ips.append(eip["PublicIp"])
+                continue
+            future = executor.submit(
+                client.release_address, AllocationId=eip["AllocationId"]
+            )
+            futures[future] = eip["PublicIp"]
+
+        for future in as_completed(futures):
+            ip = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Error occurred while releasing IP {ip}: {e}")
+                continue
+            logging.info(f"Deleted IP: {ip}")
+            deleted_ips.append(ip)
+        return deleted_ips
 
     def delete(self):
         """
@@ -114,35 +213,24 @@ class ElasticIPs(Service):
         but will not perform any operations on them.
         """
         regions = get_all_regions(self.service_name, self.default_region_name)
-
-        for region in regions:
-            eips_to_delete = {}
-            client = boto3.client(self.service_name, region_name=region)
-            addresses = client.describe_addresses()["Addresses"]
-            for eip in addresses:
-                if "NetworkInterfaceId" not in eip and "Tags" in eip:
-                    tags = eip["Tags"]
-                    if self._should_skip_instance(tags):
-                        continue
-                    if not self.filter_tags:
-                        eips_to_delete[eip["PublicIp"]] = eip["AllocationId"]
-                        continue
-                    for tag in tags:
-                        key = tag["Key"]
-                        # check for filter_tags match
-                        if key in self.filter_tags and (
-                            not self.filter_tags[key]
-                            or tag["Value"] in self.filter_tags[key]
-                        ):
-                            eips_to_delete[eip["PublicIp"]] = eip["AllocationId"]
-
-            if not self.dry_run:
-                for ip in eips_to_delete:
-                    client.release_address(AllocationId=eips_to_delete[ip])
-                    logging.info(f"Deleted IP: {ip}")
-
-            # Add deleted IPs to deleted_ips list
-            self.deleted_ips.extend(list(eips_to_delete.keys()))
+        eip_filter = self._get_filter()
+
+        # Without any tag based filter every tagged, unattached EIP is picked,
+        # so there is no need to walk through its tags.
+        no_filters = (
+            not self.filter_tags and not self.exception_tags and not self.notags
+        )
+
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as release_executor:
+            with ThreadPoolExecutor(max_workers=REGION_WORKERS) as region_executor:
+                results = region_executor.map(
+                    lambda region: self._delete_in_region(
+                        region, eip_filter, no_filters, release_executor
+                    ),
+                    regions,
+                )
+                for deleted_ips in results:
+                    self.deleted_ips.extend(deleted_ips)
 
         if not self.dry_run:
             logging.warning(
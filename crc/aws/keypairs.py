@@ -2,13 +2,34 @@
 
 import datetime
 import logging
-import re
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set
 
-import boto3
-
-from crc.aws._base import get_all_regions
+from crc.aws._base import DELETE_WORKERS, REGION_WORKERS, get_all_regions, get_client
 from crc.service import Service
+from crc.utils import compile_regex
+
+# Characters with a special meaning in a regular expression
+REGEX_SPECIAL_CHARS = set(".^$*+?{}[]\\|()")
+
+
+def _regex_to_glob(regex: str) -> Optional[str]:
+    """
+    Translates a regular expression, as used with re.search, into the equivalent EC2 filter glob.
+
+    :param regex: regular expression
+    :type regex: str
+    :return: glob matching the same names, None if the regex is not a plain string
+    :rtype: Optional[str]
+    """
+    prefix = suffix = "*"
+    if regex.startswith("^"):
+        prefix, regex = "", regex[1:]
+    if regex.endswith("$"):
+        suffix, regex = "", regex[:-1]
+    if not regex or REGEX_SPECIAL_CHARS.intersection(regex):
+        return None
+    return f"{prefix}{regex}{suffix}"
 
 
 class KeyPairs(Service):
@@ -65,6 +86,8 @@ class KeyPairs(Service):
         self.dry_run = dry_run
         self.name_regex = name_regex
         self.exception_regex = exception_regex
+        self.name_pattern = compile_regex(name_regex)
+        self.exception_pattern = compile_regex(exception_regex)
         self.age = age
 
     @property
@@ -85,59 +108,114 @@ class KeyPairs(Service):
         logging.info(f"count of items in deleted_keypairs: {count}")
         return count
 
+    def _get_filter(self) -> List[Dict[str, List[str]]]:
+        """
+        Creates a filter to be used when searching for keypairs, based on the name regex provided during initialization.
+        EC2 only supports globs for the key-name filter, so the filter is only created if every name regex is a plain
+        string, optionally anchored with ^ and $. The name regex is still checked on the returned keypairs.
+
+        :return: list of filters.
+        :rtype: List[Dict[str, List[str]]]
+        """
+        filters = []
+        globs = [_regex_to_glob(regex) for regex in self.name_regex or []]
+        if globs and all(globs):
+            filters.append({"Name": "key-name", "Values": globs})
+
+        logging.info(f"Filters created: {filters}")
+        return filters
+
+    def _scan_region(
+        self, client, keypair_filter: List[Dict[str, List[str]]]
+    ) -> Set[str]:
+        """
+        Find the keypairs of a single region that match the specified name regex and are older than the specified age.
+
+        :param client: EC2 client of the region
+        :param keypair_filter: filters passed to describe_key_pairs
+        :type keypair_filter: List[Dict[str, List[str]]]
+        :return: names of the keypairs to delete
+        :rtype: Set[str]
+        """
+        keypairs_to_delete = set()
+        keypairs = client.describe_key_pairs(Filters=keypair_filter)
+        # CreateTime is timezone aware, so a single aware "now" works for every keypair
+        now = datetime.datetime.now(datetime.timezone.utc)
+        for keypair in keypairs["KeyPairs"]:
+            if "KeyName" not in keypair or "CreateTime" not in keypair:
+                continue
+            keypair_name = keypair["KeyName"]
+            keypair_create_time = keypair["CreateTime"]
+
+            # Check if keypair name matches specified regex
+            if self.name_pattern and not self.name_pattern.search(keypair_name):
+                continue
+            if self.exception_pattern and self.exception_pattern.search(keypair_name):
+                logging.info(
+                    f"Keypair {keypair_name} is in exception_regex {self.exception_regex}."
+                )
+                continue
+
+            if self.is_old(
+                self.age,
+                now,
+                keypair_create_time,
+            ):
+                keypairs_to_delete.add(keypair_name)
+            else:
+                logging.info(f"Keypair {keypair_name} is not old enough to be deleted.")
+        return keypairs_to_delete
+
+    def _delete_keypair(self, client, keypair_name: str) -> None:
+        """
+        Delete a single keypair.
+
+        :param client: EC2 client of the region the keypair belongs to
+        :param keypair_name: name of the keypair to delete
+        :type keypair_name: str
+        """
+        response = client.delete_key_pair(KeyName=keypair_name)
+        logging.info(f"Deleted keypair: {keypair_name} with response: {response}")
+
     def delete(self):
         """
         Delete all keypairs that match the specified name regex and are older than the specified age.
         In dry_run mode, this method will only list the keypairs that match the specified filter and exception tags,
         but will not perform any operations on them.
         """
-        if self.exception_regex:
-            exception_regex = set(self.exception_regex)
-        else:
-            exception_regex = set()
-        for region in get_all_regions(self.service_name, self.default_region_name):
-            keypairs_to_delete = set()
-            client = boto3.client(self.service_name, region_name=region)
-            keypairs = client.describe_key_pairs()
-            for keypair in keypairs["KeyPairs"]:
-                if "KeyName" not in keypair or "CreateTime" not in keypair:
-                    continue
-                keypair_name = keypair["KeyName"]
-                keypair_create_time = keypair["CreateTime"]
-                dt = datetime.datetime.now().astimezone(keypair_create_time.tzinfo)
-
-                # Check if keypair name matches specified regex
-                match_name_regex = not self.name_regex or any(
-                    re.search(kpn, keypair_name) for kpn in self.name_regex
-                )
-                match_exception_regex = self.exception_regex and any(
-                    re.search(kpn, keypair_name) for kpn in exception_regex
+        regions = get_all_regions(self.service_name, self.default_region_name)
+        clients = [get_client(self.service_name, region) for region in regions]
+        keypair_filter = self._get_filter()
+
+        with ThreadPoolExecutor(max_workers=REGION_WORKERS) as executor:
+            results = list(
+                executor.map(
+                    lambda client: self._scan_region(client, keypair_filter), clients
                 )
+            )
 
-                if match_name_regex and not match_exception_regex:
-                    if self.is_old(
-                        self.age,
-                        dt,
-                        keypair_create_time,
-                    ):
-                        keypairs_to_delete.add(keypair_name)
-                    else:
-                        logging.info(
-                            f"Keypair {keypair_name} is not old enough to be deleted."
+        if self.dry_run:
+            for keypairs_to_delete in results:
+                self.deleted_keypairs.extend(keypairs_to_delete)
+        else:
+            with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                futures = {}
+                for client, keypairs_to_delete in zip(clients, results):
+                    for keypair_to_delete in keypairs_to_delete:
+                        future = executor.submit(
+                            self._delete_keypair, client, keypair_to_delete
                         )
-                else:
-                    if match_exception_regex:
-                        logging.info(
-                            f"Keypair {keypair_name} is in exception_regex {self.exception_regex}."
+                        futures[future] = keypair_to_delete
+                for future in as_completed(futures):
+                    keypair_name = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logging.error(
+                            f"Error occurred while deleting keypair {keypair_name}: {e}"
                         )
-
-            for keypair_to_delete in keypairs_to_delete:
-                if not self.dry_run:
-                    response = client.delete_key_pair(KeyName=keypair_to_delete)
-                    logging.info(
-                        f"Deleted keypair: {keypair_to_delete} with response: {response}"
-                    )
-                self.deleted_keypairs.append(keypair_to_delete)
+                        continue
+                    self.deleted_keypairs.append(keypair_name)
 
         if not self.dry_run:
             logging.warning(
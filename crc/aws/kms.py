@@ -1,14 +1,35 @@
 # Copyright (c) Yugabyte, Inc.
 
 import datetime
-import json
 import logging
-from typing import Dict, List
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-import boto3
-
-from crc.aws._base import get_all_regions
+from crc.aws._base import get_client
 from crc.service import Service
+from crc.utils import split_tag_filter
+
+try:
+    # orjson is optional, it parses the key policies faster when installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Number of keys inspected concurrently, kept low as KMS throttles aggressively
+KEY_WORKERS = 8
+
+# Number of keys submitted to the pool and not yet classified, so that keys are
+# listed as they are checked instead of all being queued up front
+MAX_PENDING_KEYS = KEY_WORKERS * 4
+
+# Error codes returned by AWS when the credentials are not allowed to make a request
+ACCESS_DENIED_ERROR_CODES = {"AccessDenied", "AccessDeniedException"}
 
 
 class Kms(Service):
@@ -64,6 +85,10 @@ class Kms(Service):
         self.kms_pending_window = kms_pending_window
         self.age = age
         self.custom_age_tag_key = custom_age_tag_key
+        self.filter_set = {
+            (k, v) for k, values in (filter_tags or {}).items() for v in values
+        }
+        self.exception_pairs, self.exception_keys = split_tag_filter(exception_tags)
 
     @property
     def get_deleted(self):
@@ -85,104 +110,257 @@ class Kms(Service):
             logging.warning("Exception tags and not present")
             return False
 
-        for tag in tags:
-            k = tag["Key"]
-            v = tag["Value"]
+        tag_values = {tag["Key"]: tag["Value"] for tag in tags}
+        return bool(
+            tag_values.items() & self.exception_pairs
+            or tag_values.keys() & self.exception_keys
+        )
+
+    def _is_active_key(self, client, key_id: str) -> bool:
+        """
+        Check if the key matches the filter and exception tags, the key description, the age threshold
+        and is associated with the kms_user.
+
+        :param client: KMS client
+        :param key_id: ID of the key to check
+        :type key_id: str
+        :return: True if the key should be deleted, False otherwise
+        :rtype: bool
+        """
+        key_tags = client.list_resource_tags(KeyId=key_id)
+        # KMS names the tag fields TagKey and TagValue, unlike the rest of AWS
+        response_tags = [
+            {"Key": tag["TagKey"], "Value": tag["TagValue"]}
+            for tag in key_tags.get("Tags", [])
+        ]
+
+        # Checks are ordered by cost: the tags are already at hand, describe_key and
+        # get_key_policy are only called for keys which can still be deleted.
+        response_set = {(tag["Key"], tag["Value"]) for tag in response_tags}
+        if not self.filter_set.issubset(response_set):
+            return False
+
+        if self._should_skip_kms(response_tags):
+            return False
+
+        key_metadata = client.describe_key(KeyId=key_id)
+        key_state = key_metadata["KeyMetadata"]["KeyState"]
+        key_des = key_metadata["KeyMetadata"]["Description"]
+        key_creation_date = key_metadata["KeyMetadata"]["CreationDate"]
 
-            if self.exception_tags:
-                if k in self.exception_tags.keys() and (
-                    not self.exception_tags[k] or v in self.exception_tags[k]
+        if key_state != "Enabled" or self.kms_key_description not in key_des:
+            return False
+
+        retention_age = self.get_retention_age(response_tags, self.custom_age_tag_key)
+        if retention_age:
+            logging.info(f"Updating age for Key: {key_id}")
+
+        if self.is_old(
+            retention_age or self.age,
+            datetime.datetime.now().astimezone(key_creation_date.tzinfo),
+            key_creation_date,
+        ):
+            policy = client.get_key_policy(KeyId=key_id, PolicyName="default")["Policy"]
+            # Most policies don't mention the user at all, no need to parse those.
+            # The text is only checked when it has no escape sequence (such as \/),
+            # as the user could then be written differently than in kms_user.
+            if "\\" not in policy and self.kms_user not in policy:
+                return False
+            policy_json = json_loads(policy)
+            for ids in policy_json["Statement"]:
+                principal = ids.get("Principal")
+                user_arns = (
+                    principal.get("AWS") if isinstance(principal, dict) else principal
+                )
+                if user_arns == self.kms_user or (
+                    isinstance(user_arns, list) and self.kms_user in user_arns
                 ):
+                    logging.info(f"Key {key_id} found with user {self.kms_user}")
                     return True
-
         return False
 
+    def _classify_key(self, client, key_id: str) -> Tuple[str, str]:
+        """
+        Classify a key as "active" (to be deleted), "skip" (not matching) or "error" (could not be checked).
+
+        :param client: KMS client
+        :param key_id: ID of the key to classify
+        :type key_id: str
+        :return: the key ID and its status
+        :rtype: Tuple[str, str]
+        """
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        # Throttling is retried by the client itself, with the adaptive retry mode set
+        # by get_client, so errors reaching this point are final for the key.
+        try:
+            if self._is_active_key(client, key_id):
+                return key_id, "active"
+            return key_id, "skip"
+        except ClientError as e:
+            logging.warning(f"KEY SKIPPED {key_id}: {e.response['Error']['Code']}")
+        except BotoCoreError as e:
+            # Connection errors and timeouts left after the client's own retries
+            logging.warning(f"KEY SKIPPED {key_id}: {e}")
+        except (KeyError, TypeError, ValueError) as e:
+            # Unexpected shape of the key metadata or policy
+            logging.warning(f"KEY SKIPPED {key_id}: {e}")
+        return key_id, "error"
+
+    def _schedule_key_deletion(self, client, cmk_id: str) -> None:
+        """
+        Schedule the deletion of a key after kms_pending_window days.
+
+        :param client: KMS client
+        :param cmk_id: ID of the key to delete
+        :type cmk_id: str
+        """
+        client.schedule_key_deletion(
+            KeyId=cmk_id, PendingWindowInDays=self.kms_pending_window
+        )
+
+    def _list_all_key_ids(self, client) -> Iterator[str]:
+        """
+        List the IDs of all the keys of the account.
+
+        :param client: KMS client
+        :return: iterator over the key IDs
+        :rtype: Iterator[str]
+        """
+        paginator = client.get_paginator("list_keys")
+        for page in paginator.paginate():
+            for key in page["Keys"]:
+                yield key["KeyId"]
+
+    def _list_key_ids(self, client) -> Iterator[str]:
+        """
+        List the IDs of the keys to check.
+        When filter_tags with values are given, only the keys carrying those tags are listed through the
+        Resource Groups Tagging API, instead of going through every key of the account.
+        The tags are still checked by _is_active_key, the tagging API only narrows down the keys to look at.
+        If the credentials are not allowed to call tag:GetResources, every key of the account is listed instead.
+
+        :param client: KMS client
+        :return: iterator over the key IDs
+        :rtype: Iterator[str]
+        """
+        from botocore.exceptions import ClientError
+
+        tag_filters = [
+            {"Key": key, "Values": values}
+            for key, values in (self.filter_tags or {}).items()
+            if values
+        ]
+        if not tag_filters:
+            yield from self._list_all_key_ids(client)
+            return
+
+        tagging_client = get_client(
+            "resourcegroupstaggingapi", self.default_region_name
+        )
+        paginator = tagging_client.get_paginator("get_resources")
+        listed = set()
+        try:
+            for page in paginator.paginate(
+                TagFilters=tag_filters, ResourceTypeFilters=["kms:key"]
+            ):
+                for resource in page["ResourceTagMappingList"]:
+                    # ARN format: arn:aws:kms:<region>:<account>:key/<key-id>
+                    key_id = resource["ResourceARN"].rsplit("/", 1)[-1]
+                    listed.add(key_id)
+                    yield key_id
+            return
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ACCESS_DENIED_ERROR_CODES:
+                raise
+            logging.warning(
+                f"Not allowed to list KMS keys by tag with tag:GetResources, listing all keys instead: {e}"
+            )
+
+        # Keys already listed before the tagging API failed are not checked twice
+        for key_id in self._list_all_key_ids(client):
+            if key_id not in listed:
+                yield key_id
+
+    def _record_classified(
+        self, futures: Iterable[Future], active_keys: List[str], skipped_keys: List[str]
+    ) -> int:
+        """
+        Sort the keys classified by the given futures of _classify_key into active and skipped keys.
+
+        :param futures: completed futures of _classify_key
+        :type futures: Iterable[Future]
+        :param active_keys: list the keys to delete are added to
+        :type active_keys: List[str]
+        :param skipped_keys: list the keys which could not be checked are added to
+        :type skipped_keys: List[str]
+        :return: number of keys classified
+        :rtype: int
+        """
+        count = 0
+        for future in futures:
+            key_id, status = future.result()
+            count += 1
+            if status == "active":
+                active_keys.append(key_id)
+            elif status == "error":
+                skipped_keys.append(key_id)
+        return count
+
     def delete(self):
         """
         Delete KMS that match the specified filter_tags.
         In dry_run mode, this method will only list the KMS (CMK) that match the specified filter,
         but will not perform any operations on them.
         """
-
-        keys = {}
         skipped_keys = []
-        kms_keys = []
         active_keys = []
-        client = boto3.client(self.service_name, region_name=self.default_region_name)
+        total_keys = 0
+        client = get_client(self.service_name, self.default_region_name)
 
-        paginator = client.get_paginator("list_keys")
-        for page in paginator.paginate():
-            kms_keys.extend(page["Keys"])
+        # Keys are listed lazily, page by page, as the pool has room for them.
+        kms_keys = self._list_key_ids(client)
 
-        logging.info(f"Total keys found = {len(kms_keys)}")
+        # KMS keys are only looked up in the default region, so the per-key
+        # requests are the ones spread over the thread pool. At most MAX_PENDING_KEYS
+        # keys are in flight, the next ones are only listed once earlier ones are done.
+        with ThreadPoolExecutor(max_workers=KEY_WORKERS) as executor:
+            pending = set()
+            for key_id in kms_keys:
+                if len(pending) >= MAX_PENDING_KEYS:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    total_keys += self._record_classified(
+                        done, active_keys, skipped_keys
+                    )
+                pending.add(executor.submit(self._classify_key, client, key_id))
+            total_keys += self._record_classified(
+                as_completed(pending), active_keys, skipped_keys
+            )
 
-        for keys in kms_keys:
-            try:
-                key_tags = client.list_resource_tags(KeyId=keys["KeyId"])
-                response_tags = key_tags.get("Tags", [])
+            logging.info(f"Total keys found = {total_keys}")
+            logging.info(f"total number of active Jenkins keys = {len(active_keys)}")
 
-                response_set = {
-                    (tag["TagKey"], tag["TagValue"]) for tag in response_tags
+            if not self.dry_run:
+                futures = {
+                    executor.submit(self._schedule_key_deletion, client, cmk_id): cmk_id
+                    for cmk_id in active_keys
                 }
-                if self.filter_tags:
-                    filter_set = {
-                        (k, v) for k, values in self.filter_tags.items() for v in values
-                    }
-                else:
-                    filter_set = set()
-
-                if not filter_set.issubset(response_set):
-                    continue
-
-                if self._should_skip_kms(response_tags):
-                    continue
-
-                key_metadata = client.describe_key(KeyId=keys["KeyId"])
-                key_state = key_metadata["KeyMetadata"]["KeyState"]
-                key_des = key_metadata["KeyMetadata"]["Description"]
-                key_creation_date = key_metadata["KeyMetadata"]["CreationDate"]
-
-                retention_age = self.get_retention_age(
-                    response_tags, self.custom_age_tag_key
-                )
-                if retention_age:
-                    logging.info(f"Updating age for Key: {keys['KeyId']}")
-
-                if (
-                    key_state == "Enabled"
-                    and self.kms_key_description in key_des
-                    and self.is_old(
-                        retention_age or self.age,
-                        datetime.datetime.now().astimezone(key_creation_date.tzinfo),
-                        key_creation_date,
-                    )
-                ):
-                    policy = client.get_key_policy(
-                        KeyId=keys["KeyId"], PolicyName="default"
-                    )["Policy"]
-                    policy_json = json.loads(policy)
-                    for ids in policy_json["Statement"]:
-                        user_arn = ids["Principal"]["AWS"]
-                        if user_arn == self.kms_user:
-                            logging.info(
-                                f"Key {keys['KeyId']} found with user {user_arn}"
-                            )
-                            active_keys.append(keys["KeyId"])
-            except:
-                logging.warning(f"KEY SKIPPED {keys['KeyId']}")
-                skipped_keys.append(keys["KeyId"])
-
-        logging.info(f"total number of active Jenkins keys = {len(active_keys)}")
-
-        if not self.dry_run:
-            for cmk_id in active_keys:
-                client.schedule_key_deletion(
-                    KeyId=cmk_id, PendingWindowInDays=self.kms_pending_window
-                )
-                logging.info(f"CMK - {cmk_id} Deleted from AWS console")
+                for future in as_completed(futures):
+                    cmk_id = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logging.error(
+                            f"Error occurred while scheduling deletion of CMK {cmk_id}: {e}"
+                        )
+                        continue
+                    logging.info(f"CMK - {cmk_id} Deleted from AWS console")
+                    # Only keys actually scheduled for deletion are reported as deleted
+                    self.kms_keys_to_delete.append(cmk_id)
 
-        # Add deleted keys to kms_keys_to_delete list
-        self.kms_keys_to_delete.extend(list(active_keys))
+        if self.dry_run:
+            # Add the keys which would be deleted to kms_keys_to_delete list
+            self.kms_keys_to_delete.extend(active_keys)
 
         if not self.dry_run:
             logging.warning(
@@ -2,12 +2,21 @@
 
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
-import boto3
-
-from crc.aws._base import get_all_regions
+from crc.aws._base import (
+    REGION_WORKERS,
+    describe_all,
+    get_all_regions,
+    get_client,
+    get_tag_filters,
+)
 from crc.service import Service
+from crc.utils import freeze_tag_values, split_tag_filter
+
+# Number of SpotInstanceRequests cancelled with a single API call
+CANCEL_BATCH_SIZE = 1000
 
 
 class SpotInstanceRequests(Service):
@@ -64,6 +73,10 @@ class SpotInstanceRequests(Service):
         self.age = age
         self.custom_age_tag_key = custom_age_tag_key
         self.notags = notags
+        self._exception_pairs, self._exception_keys = split_tag_filter(exception_tags)
+        self._notag_values = freeze_tag_values(notags)
+        # filter_tags don't change, so their describe filters are only built once
+        self._tag_filters = get_tag_filters(filter_tags)
 
     @property
     def get_deleted(self):
@@ -90,10 +103,7 @@ class SpotInstanceRequests(Service):
         :return: list of filters.
         :rtype: List[Dict[str, List[str]]]
         """
-        filters = []
-        if self.filter_tags:
-            for key, value in self.filter_tags.items():
-                filters.append({"Name": f"tag:{key}", "Values": value})
+        filters = self._tag_filters
 
         logging.info(f"Filters created: {filters}")
         return filters
@@ -107,6 +117,8 @@ class SpotInstanceRequests(Service):
         """
         spot_requests = []
         instance_ids = []
+        # Defaults to use utc timezone
+        now = datetime.datetime.now(datetime.timezone.utc)
         for request in spot_request_details["SpotInstanceRequests"]:
             try:
                 if "Tags" not in request:
@@ -128,8 +140,7 @@ class SpotInstanceRequests(Service):
 
                 if self.is_old(
                     retention_age or self.age,
-                    # Defaults to use utc timezone
-                    datetime.datetime.now().astimezone(create_time.tzinfo),
+                    now,
                     create_time,
                 ):
                     instance_ids.append(instance_id)
@@ -155,28 +166,85 @@ class SpotInstanceRequests(Service):
             logging.warning("Tags and notags not present")
             return False
 
-        in_no_tags = False
-        all_tags = {}
+        tag_values = {tag["Key"]: tag["Value"] for tag in tags}
+        if self.exception_tags and (
+            tag_values.items() & self._exception_pairs
+            or tag_values.keys() & self._exception_keys
+        ):
+            return True
 
-        for tag in tags:
-            k = tag["Key"]
-            v = tag["Value"]
+        if self.notags:
+            return all(
+                key in tag_values and (not values or tag_values[key] in values)
+                for key, values in self._notag_values.items()
+            )
+        return False
 
-            if self.exception_tags:
-                if k in self.exception_tags.keys() and (
-                    not self.exception_tags[k] or v in self.exception_tags[k]
-                ):
-                    return True
+    def _process_region(
+        self, region: str, spot_filter: List[Dict[str, List[str]]]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Deletes the SpotInstanceRequests of a single region that match the filter and age threshold.
 
-            all_tags[k] = v
+        :param region: region to clean up
+        :type region: str
+        :param spot_filter: filters passed to describe_spot_instance_requests
+        :type spot_filter: List[Dict[str, List[str]]]
+        :return: the SpotInstanceRequests deleted (or to be deleted in dry_run mode) and their instance IDs
+        :rtype: Tuple[List[str], List[str]]
+        """
+        client = get_client(self.service_name, region)
+        spot_requests = describe_all(
+            client,
+            "describe_spot_instance_requests",
+            spot_filter,
+            lambda page: page["SpotInstanceRequests"],
+            "SpotInstanceRequestId",
+        )
+        describe_spot_response = {"SpotInstanceRequests": spot_requests}
 
-        if self.notags:
-            in_no_tags = all(
-                key in all_tags and (not value or all_tags[key] in value)
-                for key, value in self.notags.items()
-            )
+        (
+            requests_to_operate,
+            instance_id_to_operate,
+        ) = self._get_filtered_requests(describe_spot_response)
+
+        if not requests_to_operate or self.dry_run:
+            return requests_to_operate, instance_id_to_operate
 
-        return in_no_tags
+        finalized_requests = []
+        finalised_instances = []
+        try:
+            for start in range(0, len(requests_to_operate), CANCEL_BATCH_SIZE):
+                batch = requests_to_operate[start : start + CANCEL_BATCH_SIZE]
+                batch_instances = instance_id_to_operate[
+                    start : start + CANCEL_BATCH_SIZE
+                ]
+                try:
+                    client.cancel_spot_instance_requests(SpotInstanceRequestIds=batch)
+                    finalized_requests.extend(batch)
+                    finalised_instances.extend(batch_instances)
+                    continue
+                except Exception as e:
+                    logging.error(
+                        f"Error occured while deleting spot instance requests {batch}, retrying one by one: {e}"
+                    )
+                # A single invalid ID fails the whole batch, so fall back to one call per request
+                for req, instance_id in zip(batch, batch_instances):
+                    try:
+                        client.cancel_spot_instance_requests(
+                            SpotInstanceRequestIds=[req]
+                        )
+                        finalized_requests.append(req)
+                        finalised_instances.append(instance_id)
+                    except Exception as e:
+                        logging.error(
+                            f"Error occured while deleting spot instance request {req}: {e}"
+                        )
+            for request_id in finalized_requests:
+                logging.info(f"Spot Instance Request: {request_id} deleted.")
+        except Exception as e:
+            logging.error(f"Error occurred while deleting spot instance requests: {e}")
+        return finalized_requests, finalised_instances
 
     def delete(
         self,
@@ -189,46 +257,14 @@ class SpotInstanceRequests(Service):
         any operations on them if dry_run mode is enabled.
         """
         spot_filter = self._get_filter()
-        for region in get_all_regions(self.service_name, self.default_region_name):
-            client = boto3.client(self.service_name, region_name=region)
-            describe_spot_response = client.describe_spot_instance_requests(
-                Filters=spot_filter
+        regions = get_all_regions(self.service_name, self.default_region_name)
+        with ThreadPoolExecutor(max_workers=REGION_WORKERS) as executor:
+            results = executor.map(
+                lambda region: self._process_region(region, spot_filter), regions
             )
-
-            (
-                requests_to_operate,
-                instance_id_to_operate,
-            ) = self._get_filtered_requests(describe_spot_response)
-
-            if requests_to_operate:
-                try:
-                    finalized_requests = []
-                    finalised_instances = []
-                    if not self.dry_run:
-                        for ind, req in enumerate(requests_to_operate):
-                            try:
-                                client.cancel_spot_instance_requests(
-                                    SpotInstanceRequestIds=[req]
-                                )
-                                finalized_requests.append(req)
-                                finalised_instances.append(instance_id_to_operate[ind])
-                            except Exception as e:
-                                logging.error(
-                                    f"Error occured while deleting spot instance request {req}: {e}"
-                                )
-                        for i in range(len(finalized_requests)):
-                            logging.info(
-                                f"Spot Instance Request: {finalized_requests[i]} deleted."
-                            )
-                        self.spot_requests_to_delete.extend(finalized_requests)
-                        self.instance_ids_to_delete.extend(finalised_instances)
-                    else:
-                        self.spot_requests_to_delete.extend(requests_to_operate)
-                        self.instance_ids_to_delete.extend(instance_id_to_operate)
-                except Exception as e:
-                    logging.error(
-                        f"Error occurred while deleting spot instance requests: {e}"
-                    )
+            for spot_requests, instance_ids in results:
+                self.spot_requests_to_delete.extend(spot_requests)
+                self.instance_ids_to_delete.extend(instance_ids)
 
         if not self.spot_requests_to_delete:
             logging.warning(f"No SpotInstanceRequest to delete.")
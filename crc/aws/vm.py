@@ -2,12 +2,22 @@
 
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
-import boto3
-
-from crc.aws._base import get_all_regions
+from crc.aws._base import (
+    REGION_WORKERS,
+    describe_all,
+    get_all_regions,
+    get_client,
+    get_tag_filters,
+)
 from crc.service import Service
+from crc.utils import freeze_tag_values, split_tag_filter
+
+# Number of instances terminated or stopped with a single API call, kept well
+# below the API limit so that a region's requests stay small and spread out
+OPERATION_BATCH_SIZE = 100
 
 
 class VM(Service):
@@ -69,6 +79,10 @@ class VM(Service):
         self.age = age
         self.custom_age_tag_key = custom_age_tag_key
         self.notags = notags
+        self._exception_pairs, self._exception_keys = split_tag_filter(exception_tags)
+        self._notag_values = freeze_tag_values(notags)
+        # filter_tags don't change, so their describe filters are only built once
+        self._tag_filters = get_tag_filters(filter_tags)
 
     @property
     def get_deleted(self):
@@ -120,16 +134,13 @@ class VM(Service):
                 "Name": "instance-state-name",
                 "Values": instance_state,
             }
-        ]
-        if self.filter_tags:
-            for key, value in self.filter_tags.items():
-                filters.append({"Name": f"tag:{key}", "Values": value})
+        ] + self._tag_filters
 
         logging.info(f"Filters created: {filters}")
         return filters
 
     def _get_filtered_instances(
-        self, ec2: boto3.client, instance_details: dict
+        self, instance_details: dict
     ) -> Tuple[List[str], List[str]]:
         """
         Retrieves a list of instances that match the filter and age threshold,
@@ -137,62 +148,65 @@ class VM(Service):
         """
         instance_ids = []
         instance_names = []
+        # AttachTime is timezone aware, so a single aware "now" works for every instance
+        now = datetime.datetime.now(datetime.timezone.utc)
         for reservation in instance_details["Reservations"]:
             for i in reservation["Instances"]:
-                try:
-                    instance_name = None
-                    if "Tags" not in i:
-                        continue
-                    tags = i["Tags"]
-                    if self._should_skip_instance(tags):
-                        continue
-                    instance_name = self._get_instance_name(tags)
-                    if not instance_name:
-                        logging.error(
-                            f"{instance_name} instance doesn't have Name Tag. Skipping it"
-                        )
-                        continue
-                    instance_id = i["InstanceId"]
-                    network_interface_id = i["NetworkInterfaces"][0][
-                        "NetworkInterfaceId"
-                    ]
-                    network_interface_details = ec2.describe_network_interfaces(
-                        NetworkInterfaceIds=[network_interface_id]
+                if "Tags" not in i:
+                    continue
+                tags = i["Tags"]
+                # Built once per instance and shared by all the tag checks below
+                tag_values = {tag["Key"]: tag["Value"] for tag in tags}
+                if self._should_skip_instance(tag_values):
+                    continue
+                instance_name = tag_values.get("Name")
+                instance_id = i["InstanceId"]
+                if not instance_name:
+                    logging.error(
+                        f"Instance {instance_id} doesn't have Name Tag. Skipping it"
                     )
-                    network_interface_attached_time = network_interface_details[
-                        "NetworkInterfaces"
-                    ][0]["Attachment"]["AttachTime"]
-
-                    logging.info(tags)
-                    retention_age = self.get_retention_age(
-                        tags, self.custom_age_tag_key
+                    continue
+                # describe_instances already returns the attachment of each NIC
+                network_interfaces = i.get("NetworkInterfaces")
+                if not network_interfaces or "Attachment" not in network_interfaces[0]:
+                    logging.error(
+                        f"Instance {instance_name} has no attached network interface. Skipping it"
                     )
-                    if retention_age:
-                        logging.info(f"Updating age for instance_id: {instance_id}")
+                    continue
+                network_interface_attached_time = network_interfaces[0]["Attachment"][
+                    "AttachTime"
+                ]
 
-                    if self.is_old(
+                logging.debug(tags)
+                retention_age = self.get_retention_age(tags, self.custom_age_tag_key)
+                if retention_age:
+                    logging.info(f"Updating age for instance_id: {instance_id}")
+
+                try:
+                    is_old = self.is_old(
                         retention_age or self.age,
-                        datetime.datetime.now().astimezone(
-                            network_interface_attached_time.tzinfo
-                        ),
+                        now,
                         network_interface_attached_time,
-                    ):
-                        instance_ids.append(instance_id)
-                        instance_names.append(instance_name)
-                        logging.info(
-                            f"Instance {instance_name} with ID {instance_id} added to list of instances to be cleaned up."
-                        )
+                    )
                 except Exception as e:
+                    # The custom age tag may hold an invalid age
                     logging.error(
                         f"Error occurred while processing {instance_name} instance: {e}"
                     )
+                    continue
+                if is_old:
+                    instance_ids.append(instance_id)
+                    instance_names.append(instance_name)
+                    logging.debug(
+                        f"Instance {instance_name} with ID {instance_id} added to list of instances to be cleaned up."
+                    )
         return instance_ids, instance_names
 
-    def _should_skip_instance(self, tags: List[Dict[str, str]]) -> bool:
+    def _should_skip_instance(self, tag_values: Dict[str, str]) -> bool:
         """
         Check if the instance should be skipped based on the exception tags and instances that do not have the specified notags.
-        :param tags: List of tags associated with the instance
-        :type tags: List[Dict[str,str]]
+        :param tag_values: Tags associated with the instance, as a key to value mapping
+        :type tag_values: Dict[str,str]
         :return: True if the instance should be skipped, False otherwise
         :rtype: bool
         """
@@ -200,41 +214,101 @@ class VM(Service):
             logging.warning("Tags and notags not present")
             return False
 
-        in_no_tags = False
-        all_tags = {}
-
-        for tag in tags:
-            k = tag["Key"]
-            v = tag["Value"]
-
-            if self.exception_tags:
-                if k in self.exception_tags.keys() and (
-                    not self.exception_tags[k] or v in self.exception_tags[k]
-                ):
-                    return True
-
-            all_tags[k] = v
+        if self.exception_tags and (
+            tag_values.items() & self._exception_pairs
+            or tag_values.keys() & self._exception_keys
+        ):
+            return True
 
         if self.notags:
-            in_no_tags = all(
-                key in all_tags and (not value or all_tags[key] in value)
-                for key, value in self.notags.items()
+            return all(
+                key in tag_values and (not values or tag_values[key] in values)
+                for key, values in self._notag_values.items()
             )
+        return False
 
-        return in_no_tags
-
-    def _get_instance_name(self, tags: List[Dict[str, str]]) -> str:
+    def _process_region(
+        self,
+        region: str,
+        operation_type: str,
+        instance_filter: List[Dict[str, List[str]]],
+    ) -> List[str]:
         """
-        Retrieves the instance name from its tags
-        :param tags: List of tags associated with the instance
-        :type tags: List[Dict[str,str]]
-        :return: the instance name if found, None otherwise
-        :rtype: str
+        Perform the specified operation (delete or stop) on the matching instances of a single region.
+
+        :param region: region to clean up
+        :type region: str
+        :param operation_type: The type of operation to perform (delete or stop)
+        :type operation_type: str
+        :param instance_filter: filters passed to describe_instances
+        :type instance_filter: List[Dict[str, List[str]]]
+        :return: names of the instances deleted or stopped (or to be, in dry_run mode)
+        :rtype: List[str]
         """
-        for tag in tags:
-            if tag["Key"] == "Name":
-                return tag["Value"]
-        return None
+        client = get_client(self.service_name, region)
+        instances = describe_all(
+            client,
+            "describe_instances",
+            instance_filter,
+            lambda page: (
+                i
+                for reservation in page["Reservations"]
+                for i in reservation["Instances"]
+            ),
+            "InstanceId",
+        )
+        # Renaming instance_details to describe_instances_response for better understanding
+        describe_instances_response = {"Reservations": [{"Instances": instances}]}
+
+        (
+            instances_to_operate,
+            instance_names_to_operate,
+        ) = self._get_filtered_instances(describe_instances_response)
+
+        logging.info(
+            f"Region {region}: {len(instances_to_operate)} instances to {operation_type}"
+        )
+        if not instances_to_operate or self.dry_run:
+            return instance_names_to_operate
+
+        if operation_type == "delete":
+            operation = client.terminate_instances
+        elif operation_type == "stop":
+            operation = client.stop_instances
+        else:
+            return []
+
+        finalized_instances = []
+        try:
+            for start in range(0, len(instances_to_operate), OPERATION_BATCH_SIZE):
+                batch = instances_to_operate[start : start + OPERATION_BATCH_SIZE]
+                batch_names = instance_names_to_operate[
+                    start : start + OPERATION_BATCH_SIZE
+                ]
+                try:
+                    operation(InstanceIds=batch)
+                    finalized_instances.extend(batch_names)
+                    continue
+                except Exception as e:
+                    logging.error(
+                        f"Error occurred while {operation_type} instances {batch}, retrying one by one: {e}"
+                    )
+                # A single failing instance fails the whole batch, so fall back to one call per instance
+                for ins, instance_name in zip(batch, batch_names):
+                    try:
+                        operation(InstanceIds=[ins])
+                        finalized_instances.append(instance_name)
+                    except Exception as e:
+                        logging.error(
+                            f"Error occurred while {operation_type} instance {ins}: {e}"
+                        )
+            # A single record per region, the full list is part of the final summary
+            logging.info(
+                f"Region {region}: {len(finalized_instances)} instances {'deleted' if operation_type == 'delete' else 'stopped'}"
+            )
+        except Exception as e:
+            logging.error(f"Error occurred while {operation_type} instances: {e}")
+        return finalized_instances
 
     def _perform_operation(
         self,
@@ -252,65 +326,19 @@ class VM(Service):
         """
         # Renaming filter to instance_filter for better understanding
         instance_filter = self._get_filter(instance_state)
-        for region in get_all_regions(self.service_name, self.default_region_name):
-            client = boto3.client(self.service_name, region_name=region)
-            # Renaming instance_details to describe_instances_response for better understanding
-            describe_instances_response = client.describe_instances(
-                Filters=instance_filter
+        regions = get_all_regions(self.service_name, self.default_region_name)
+        with ThreadPoolExecutor(max_workers=REGION_WORKERS) as executor:
+            results = executor.map(
+                lambda region: self._process_region(
+                    region, operation_type, instance_filter
+                ),
+                regions,
             )
-
-            (
-                instances_to_operate,
-                instance_names_to_operate,
-            ) = self._get_filtered_instances(client, describe_instances_response)
-
-            if instances_to_operate:
-                try:
-                    finalized_instances = []
-                    if operation_type == "delete":
-                        if not self.dry_run:
-                            for ind, ins in enumerate(instances_to_operate):
-                                try:
-                                    client.terminate_instances(InstanceIds=[ins])
-                                    finalized_instances.append(
-                                        instance_names_to_operate[ind]
-                                    )
-                                except Exception as e:
-                                    logging.error(
-                                        f"Error occured while {operation_type} instance {ins}: {e}"
-                                    )
-                            for i in range(len(finalized_instances)):
-                                logging.info(
-                                    f"Instance: {finalized_instances[i]} deleted."
-                                )
-                            self.instance_names_to_delete.extend(finalized_instances)
-                        else:
-                            self.instance_names_to_delete.extend(
-                                instance_names_to_operate
-                            )
-                    elif operation_type == "stop":
-                        if not self.dry_run:
-                            for ind, ins in enumerate(instances_to_operate):
-                                try:
-                                    client.stop_instances(InstanceIds=[ins])
-                                    finalized_instances.append(
-                                        instance_names_to_operate[ind]
-                                    )
-                                except Exception as e:
-                                    logging.error(
-                                        f"Error occurred while {operation_type} instance {ins}: {e}"
-                                    )
-                            for i in range(len(finalized_instances)):
-                                logging.info(
-                                    f"Instance {finalized_instances[i]} stopped."
-                                )
-                            self.instance_names_to_stop.extend(finalized_instances)
-                        else:
-                            self.instance_names_to_stop.extend(instances_to_operate)
-                except Exception as e:
-                    logging.error(
-                        f"Error occurred while {operation_type} instances: {e}"
-                    )
+            for instance_names in results:
+                if operation_type == "delete":
+                    self.instance_names_to_delete.extend(instance_names)
+                elif operation_type == "stop":
+                    self.instance_names_to_stop.extend(instance_names)
 
         # Using more descriptive if conditions
         if not self.instance_names_to_delete and not self.instance_names_to_stop:
@@ -1,12 +1,26 @@
 # Copyright (c) Yugabyte, Inc.
 
 import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
-import boto3
-
-from crc.aws._base import get_all_regions
+from crc.aws._base import (
+    REGION_WORKERS,
+    get_all_regions,
+    get_client,
+    get_resource,
+    get_tag_filters,
+)
 from crc.service import Service
+from crc.utils import freeze_tag_values, split_tag_filter
+
+# Number of attempts at deleting a VPC whose dependencies are still being cleaned up
+VPC_DELETE_RETRIES = 5
+
+# Upper bound, in seconds, of the wait between two attempts at deleting a VPC
+VPC_DELETE_MAX_BACKOFF = 30
 
 
 class VPC(Service):
@@ -56,6 +70,10 @@ class VPC(Service):
         self.filter_tags = filter_tags
         self.exception_tags = exception_tags
         self.notags = notags
+        self._exception_pairs, self._exception_keys = split_tag_filter(exception_tags)
+        self._notag_values = freeze_tag_values(notags)
+        # filter_tags don't change, so their describe filters are only built once
+        self._tag_filters = get_tag_filters(filter_tags)
 
     @property
     def get_deleted(self):
@@ -82,10 +100,7 @@ class VPC(Service):
         :return: list of filters.
         :rtype: List[Dict[str, List[str]]]
         """
-        filters = []
-        if self.filter_tags:
-            for key, value in self.filter_tags.items():
-                filters.append({"Name": f"tag:{key}", "Values": value})
+        filters = self._tag_filters
 
         logging.info(f"Filters created: {filters}")
         return filters
@@ -102,28 +117,19 @@ class VPC(Service):
             logging.warning("Tags and notags not present")
             return False
 
-        in_no_tags = False
-        all_tags = {}
-
-        for tag in tags:
-            k = tag["Key"]
-            v = tag["Value"]
-
-            if self.exception_tags:
-                if k in self.exception_tags.keys() and (
-                    not self.exception_tags[k] or v in self.exception_tags[k]
-                ):
-                    return True
-
-            all_tags[k] = v
+        tag_values = {tag["Key"]: tag["Value"] for tag in tags}
+        if self.exception_tags and (
+            tag_values.items() & self._exception_pairs
+            or tag_values.keys() & self._exception_keys
+        ):
+            return True
 
         if self.notags:
-            in_no_tags = all(
-                key in all_tags and (not value or all_tags[key] in value)
-                for key, value in self.notags.items()
+            return all(
+                key in tag_values and (not values or tag_values[key] in values)
+                for key, values in self._notag_values.items()
             )
-
-        return in_no_tags
+        return False
 
     def get_vpc_ids(self, vpcs):
         """
@@ -140,95 +146,127 @@ class VPC(Service):
             vpc_ids.append(vpc.id)
         return vpc_ids
 
-    def delete(self) -> None:
+    def _process_region(
+        self, region: str, vpc_filter: List[Dict[str, List[str]]]
+    ) -> List[str]:
         """
-        Deletes VPCs that match the filter threshold, and also checks for exception tags.
-        It checks if the filter_tags and notags attribute of the class is empty,
-        if so, it returns True because there are no tags set to filter the VPCs, so any VPC should be considered.
-
-        The method will list the VPCs that match the specified filter and exception tags but will not perform any operations
-        on them if dry_run mode is enabled.
+        Deletes the VPCs of a single region that match the filter.
+
+        :param region: region to clean up
+        :type region: str
+        :param vpc_filter: filters passed to describe_vpcs
+        :type vpc_filter: List[Dict[str, List[str]]]
+        :return: IDs of the VPCs deleted (or to be deleted in dry_run mode)
+        :rtype: List[str]
         """
-        vpc_filter = self._get_filter()
+        client = get_client(self.service_name, region)
+        ec2 = get_resource(self.service_name, region)
+        vpcs = list(ec2.vpcs.filter(Filters=vpc_filter))
 
-        for region in get_all_regions(self.service_name, self.default_region_name):
-            client = boto3.client(self.service_name, region_name=region)
-            ec2 = boto3.resource(self.service_name, region_name=region)
-            vpcs = list(ec2.vpcs.filter(Filters=vpc_filter))
+        vpc_ids = self.get_vpc_ids(vpcs)
 
-            self.vpc_ids_to_delete.extend(self.get_vpc_ids(vpcs))
+        if self.dry_run:
+            return vpc_ids
 
-            if self.dry_run:
+        for vpc in vpcs:
+            if self._should_skip_vpc(vpc.tags or []):
                 continue
 
-            for vpc in vpcs:
-                if self._should_skip_vpc(vpc):
-                    continue
-
-                # Detach default dhcp_options if associated with the VPC
-                dhcp_options_default = ec2.DhcpOptions("default")
-                if dhcp_options_default:
-                    dhcp_options_default.associate_with_vpc(VpcId=vpc.id)
-
-                # Detach and delete all gateways associated with the VPC
-                for gw in vpc.internet_gateways.all():
-                    vpc.detach_internet_gateway(InternetGatewayId=gw.id)
-                    gw.delete()
-
-                # Delete all route table associations
-                for rt in vpc.route_tables.all():
-                    for rta in rt.associations:
-                        if not rta.main:
-                            rta.delete()
-                    if not rt.associations:
-                        rt.delete()
-
-                # Delete any instances
-                for subnet in vpc.subnets.all():
-                    for instance in subnet.instances.all():
-                        instance.terminate()
-
-                # Delete endpoints
+            # Detach default dhcp_options if associated with the VPC
+            dhcp_options_default = ec2.DhcpOptions("default")
+            if dhcp_options_default:
+                dhcp_options_default.associate_with_vpc(VpcId=vpc.id)
+
+            # Detach and delete all gateways associated with the VPC
+            for gw in vpc.internet_gateways.all():
+                vpc.detach_internet_gateway(InternetGatewayId=gw.id)
+                gw.delete()
+
+            # Delete all route table associations
+            for rt in vpc.route_tables.all():
+                for rta in rt.associations:
+                    if not rta.main:
+                        rta.delete()
+                if not rt.associations:
+                    rt.delete()
+
+            # Delete any instances, with a single call for the whole VPC
+            instance_ids = [instance.id for instance in vpc.instances.all()]
+            if instance_ids:
+                client.terminate_instances(InstanceIds=instance_ids)
+
+            # Delete endpoints, delete_vpc_endpoints accepts all of them at once
+            endpoint_ids = [
+                ep["VpcEndpointId"]
                 for ep in client.describe_vpc_endpoints(
                     Filters=[{"Name": "vpc-id", "Values": [vpc.id]}]
-                )["VpcEndpoints"]:
-                    client.delete_vpc_endpoints(VpcEndpointIds=[ep["VpcEndpointId"]])
-
-                # Delete security groups
-                for sg in vpc.security_groups.all():
-                    if sg.group_name != "default":
-                        sg.delete()
-
-                # Delete VPC peering connections
-                for vpcpeer in client.describe_vpc_peering_connections(
-                    Filters=[{"Name": "requester-vpc-info.vpc-id", "Values": [vpc.id]}]
-                )["VpcPeeringConnections"]:
-                    ec2.VpcPeeringConnection(vpcpeer["VpcPeeringConnectionId"]).delete()
-
-                # Delete non-default network ACLs
-                for netacl in vpc.network_acls.all():
-                    if not netacl.is_default:
-                        netacl.delete()
-
-                # Delete network interfaces
-                for subnet in vpc.subnets.all():
-                    for interface in subnet.network_interfaces.all():
-                        interface.delete()
-                    subnet.delete()
-
-                # Finally, delete the VPC
-                retry = 5
-                for _ in range(retry):
-                    try:
-                        client.delete_vpc(VpcId=vpc.id)
-                        break
-                    except Exception as e:
-                        logging.error(e)
-                        logging.error(f"Failed deleting VPC {vpc.id}. Retrying...")
-                else:
+                )["VpcEndpoints"]
+            ]
+            if endpoint_ids:
+                client.delete_vpc_endpoints(VpcEndpointIds=endpoint_ids)
+
+            # Delete security groups
+            for sg in vpc.security_groups.all():
+                if sg.group_name != "default":
+                    sg.delete()
+
+            # Delete VPC peering connections
+            for vpcpeer in client.describe_vpc_peering_connections(
+                Filters=[{"Name": "requester-vpc-info.vpc-id", "Values": [vpc.id]}]
+            )["VpcPeeringConnections"]:
+                ec2.VpcPeeringConnection(vpcpeer["VpcPeeringConnectionId"]).delete()
+
+            # Delete non-default network ACLs
+            for netacl in vpc.network_acls.all():
+                if not netacl.is_default:
+                    netacl.delete()
+
+            # Delete network interfaces
+            for subnet in vpc.subnets.all():
+                for interface in subnet.network_interfaces.all():
+                    interface.delete()
+                subnet.delete()
+
+            # Finally, delete the VPC
+            for attempt in range(VPC_DELETE_RETRIES):
+                try:
+                    client.delete_vpc(VpcId=vpc.id)
+                    break
+                except Exception as e:
+                    logging.error(e)
+                    if attempt == VPC_DELETE_RETRIES - 1:
+                        continue
+                    # Dependencies such as terminating instances take a while to go away,
+                    # so wait longer after each failure, with jitter
+                    backoff = min(2**attempt + random.random(), VPC_DELETE_MAX_BACKOFF)
                     logging.error(
-                        f"Failed to Delete VPC {vpc.id} after {retry} retries"
+                        f"Failed deleting VPC {vpc.id}. Retrying in {backoff:.1f}s..."
                     )
+                    time.sleep(backoff)
+            else:
+                logging.error(
+                    f"Failed to Delete VPC {vpc.id} after {VPC_DELETE_RETRIES} retries"
+                )
+        return vpc_ids
+
+    def delete(self) -> None:
+        """
+        Deletes VPCs that match the filter threshold, and also checks for exception tags.
+        It checks if the filter_tags and notags attribute of the class is empty,
+        if so, it returns True because there are no tags set to filter the VPCs, so any VPC should be considered.
+
+        The method will list the VPCs that match the specified filter and exception tags but will not perform any operations
+        on them if dry_run mode is enabled.
+        """
+        vpc_filter = self._get_filter()
+        regions = get_all_regions(self.service_name, self.default_region_name)
+        with ThreadPoolExecutor(max_workers=REGION_WORKERS) as executor:
+            results = executor.map(
+                lambda region: self._process_region(region, vpc_filter), regions
+            )
+            for vpc_ids in results:
+                self.vpc_ids_to_delete.extend(vpc_ids)
+
         if self.dry_run:
             logging.warning(
                 f"List of AWS VPCs (Total: {len(self.vpc_ids_to_delete)}) which will be deleted: {self.vpc_ids_to_delete}"
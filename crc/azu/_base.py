@@ -1,11 +1,38 @@
 # Copyright (c) Yugabyte, Inc.
 
+import functools
 import os
 
 from azure.identity import ClientSecretCredential
 from azure.mgmt.compute import ComputeManagementClient
 from azure.mgmt.network import NetworkManagementClient
 
+# Number of delete calls issued concurrently
+DELETE_WORKERS = 10
+
+
+@functools.lru_cache(maxsize=None)
+def get_credential(
+    tenant_id: str, client_id: str, client_secret: str
+) -> ClientSecretCredential:
+    """
+    Return the credential for the given Azure application.
+    The credential caches its access token, so it is shared by every Base object
+    to only go through the token exchange once per process.
+
+    :param tenant_id: The tenant ID associated with the Azure subscription
+    :type tenant_id: str
+    :param client_id: The client ID for the Azure application that will authenticate to Azure
+    :type client_id: str
+    :param client_secret: The client secret for the Azure application that will authenticate to Azure
+    :type client_secret: str
+    :return: credential of the Azure application
+    :rtype: ClientSecretCredential
+    """
+    return ClientSecretCredential(
+        tenant_id=tenant_id, client_id=client_id, client_secret=client_secret
+    )
+
 
 class Base:
     """
@@ -16,12 +43,8 @@ class Base:
         """
         Initialize the class with environment variables for Azure credentials.
         """
-        self.compute_client = (
-            {}
-        )  # Dictionary to store the ComputeManagementClient object, used to implement the singleton pattern
-        self.network_client = (
-            {}
-        )  # Dictionary to store the NetworkManagementClient object, used to implement the singleton pattern
+        self.compute_client = None  # The ComputeManagementClient object, created on first use (singleton pattern)
+        self.network_client = None  # The NetworkManagementClient object, created on first use (singleton pattern)
 
         # Environment variables for Azure credentials
         self.subscription_id = os.environ[
@@ -40,11 +63,7 @@ class Base:
             resource_group if resource_group else os.environ["AZURE_RESOURCE_GROUP"]
         )  # The name of the resource group you want to manage resources in.
 
-        self.credential = ClientSecretCredential(
-            tenant_id=self.tenant_id,  # The tenant ID associated with the Azure subscription
-            client_id=self.client_id,  # The client ID for the Azure application that will authenticate to Azure
-            client_secret=self.secret,  # The client secret for the Azure application that will authenticate to Azure
-        )
+        self.credential = get_credential(self.tenant_id, self.client_id, self.secret)
 
     def get_compute_client(self):
         """
@@ -52,7 +71,7 @@ class Base:
         This method uses the singleton pattern to ensure that only one instance of the client is created,
         and that the same instance is returned every time this method is called.
         """
-        if self.compute_client:
+        if self.compute_client is not None:
             return self.compute_client
         self.compute_client = ComputeManagementClient(
             credential=self.credential,
@@ -66,7 +85,7 @@ class Base:
         This method uses the singleton pattern to ensure that only one instance of the client is created,
         and that the same instance is returned every time this method is called.
         """
-        if self.network_client:
+        if self.network_client is not None:
             return self.network_client
         self.network_client = NetworkManagementClient(
             self.credential, self.subscription_id
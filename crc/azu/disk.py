@@ -2,10 +2,12 @@
 
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List
 
-from crc.azu._base import Base
+from crc.azu._base import DELETE_WORKERS, Base
 from crc.service import Service
+from crc.utils import freeze_tag_values, split_tag_filter
 
 
 class Disk(Service):
@@ -49,6 +51,10 @@ class Disk(Service):
         self.age = age
         self.custom_age_tag_key = custom_age_tag_key
         self.notags = notags
+        # Tag filters don't change, so they are turned into sets only once
+        self._filter_pairs, self._filter_keys = split_tag_filter(filter_tags)
+        self._exception_pairs, self._exception_keys = split_tag_filter(exception_tags)
+        self._notag_values = freeze_tag_values(notags)
 
     @property
     def get_deleted(self):
@@ -68,70 +74,110 @@ class Disk(Service):
         logging.info(f"count of items in disks_names_to_delete: {count}")
         return count
 
-    def delete(self):
+    def _delete_disk(self, disk_name: str) -> None:
         """
-        Deletes disks that match the specified filter tags, do not match the specified exception tags and notags, and are older than the specified age.
-        And if the dry_run is False, it will perform the deletion operation otherwise it will only list the resources that match the specified filter and exception tags.
+        Delete a single disk.
+
+        :param disk_name: name of the disk to delete
+        :type disk_name: str
         """
+        self.base.get_compute_client().disks.begin_delete(
+            self.base.resource_group, disk_name
+        )
+        logging.info("Deleted disk: " + disk_name)
 
-        # Get a list of all disks
-        disks = self.base.get_compute_client().disks.list()
-
-        # Iterate through each disk
-        for disk in disks:
-            # Check if the disk has the specified filter tags
-            filter_tags_match = not self.filter_tags or (
-                disk.tags
-                and any(
-                    key in disk.tags and (not value or disk.tags[key] in value)
-                    for key, value in self.filter_tags.items()
-                )
+    def _should_delete_disk(self, disk, now: datetime.datetime) -> bool:
+        """
+        Check if the disk matches the filter tags, does not match the exception tags and notags,
+        is older than the specified age and is in a state that is allowed for deletion.
+
+        :param disk: disk as returned by the compute client
+        :param now: current time
+        :type now: datetime.datetime
+        :return: True if the disk should be deleted, False otherwise
+        :rtype: bool
+        """
+        # Check if the disk has the specified filter tags
+        filter_tags_match = not self.filter_tags or (
+            disk.tags
+            and bool(
+                disk.tags.items() & self._filter_pairs
+                or disk.tags.keys() & self._filter_keys
             )
-
-            # Check if the disk has the specified exception tags
-            exception_tags_match = (
-                self.exception_tags
-                and disk.tags
-                and any(
-                    key in disk.tags and (not value or disk.tags[key] in value)
-                    for key, value in self.exception_tags.items()
-                )
+        )
+
+        # Check if the disk has the specified exception tags
+        exception_tags_match = (
+            self.exception_tags
+            and disk.tags
+            and bool(
+                disk.tags.items() & self._exception_pairs
+                or disk.tags.keys() & self._exception_keys
             )
-
-            # Check if the disk has the specified notags tags
-            no_tags_match = (
-                self.notags
-                and disk.tags
-                and all(
-                    key in disk.tags and (not value or disk.tags[key] in value)
-                    for key, value in self.notags.items()
-                )
+        )
+
+        # Check if the disk has the specified notags tags
+        no_tags_match = (
+            self.notags
+            and disk.tags
+            and all(
+                key in disk.tags and (not value or disk.tags[key] in value)
+                for key, value in self._notag_values.items()
             )
+        )
+
+        # Check if the disk matches the specified filter tags and not exception tags
+        if filter_tags_match and not exception_tags_match and not no_tags_match:
+            logging.info(disk.tags)
+            retention_age = self.get_retention_age(disk.tags, self.custom_age_tag_key)
+            if retention_age:
+                logging.info(f"Updating age for disk: {disk.name}")
+
+            # Compare the current time to the disk's time created
+            if self.is_old(retention_age or self.age, now, disk.time_created):
+                # Check if the disk is in a state that is allowed for deletion.
+                # disk_state may be a str enum, which compares equal to its value.
+                if disk.disk_state in self.default_disk_state:
+                    return True
+        return False
+
+    def delete(self):
+        """
+        Deletes disks that match the specified filter tags, do not match the specified exception tags and notags, and are older than the specified age.
+        And if the dry_run is False, it will perform the deletion operation otherwise it will only list the resources that match the specified filter and exception tags.
+        """
+        # time_created is timezone aware, so a single aware "now" works for every disk
+        now = datetime.datetime.now(datetime.timezone.utc)
+
+        # Disks are deleted from the resource group, so only the disks of that group are listed
+        disks = self.base.get_compute_client().disks.list_by_resource_group(
+            self.base.resource_group
+        )
+
+        # Every matching disk is submitted for deletion as soon as it is found, so the
+        # next pages of the listing are fetched while the deletions are under way.
+        # begin_delete only starts the operation, so the calls are issued concurrently.
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            futures = {}
+            for disk in disks:
+                if not self._should_delete_disk(disk, now):
+                    continue
+                if self.dry_run:
+                    self.disks_names_to_delete.append(disk.name)
+                    continue
+                futures[executor.submit(self._delete_disk, disk.name)] = disk.name
+
+            for future in as_completed(futures):
+                disk_name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(
+                        f"Error occurred while deleting disk {disk_name}: {e}"
+                    )
+                    continue
+                self.disks_names_to_delete.append(disk_name)
 
-            # Check if the disk matches the specified filter tags and not exception tags
-            if filter_tags_match and not exception_tags_match and not no_tags_match:
-                logging.info(disk.tags)
-                retention_age = self.get_retention_age(
-                    disk.tags, self.custom_age_tag_key
-                )
-                if retention_age:
-                    logging.info(f"Updating age for disk: {disk.name}")
-
-                # Get the current time and compare it to the disk's time created
-                dt = datetime.datetime.now().astimezone(disk.time_created.tzinfo)
-                if self.is_old(retention_age or self.age, dt, disk.time_created):
-                    # Check if the disk is in a state that is allowed for deletion
-                    if any(
-                        disk.disk_state in state for state in self.default_disk_state
-                    ):
-                        if not self.dry_run:
-                            # Delete the disk
-                            self.base.get_compute_client().disks.begin_delete(
-                                self.base.resource_group, disk.name
-                            )
-                            # Log that the disk was deleted
-                            logging.info("Deleted disk: " + disk.name)
-                        self.disks_names_to_delete.append(disk.name)
         if not self.dry_run:
             logging.warning(
                 f"number of Azure Disks deleted: {len(self.disks_names_to_delete)}"
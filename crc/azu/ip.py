@@ -1,9 +1,11 @@
 # Copyright (c) Yugabyte, Inc.
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from crc.azu._base import Base
+from crc.azu._base import DELETE_WORKERS, Base
 from crc.service import Service
+from crc.utils import freeze_tag_values, split_tag_filter
 
 
 class IP(Service):
@@ -35,6 +37,10 @@ class IP(Service):
         self.filter_tags = filter_tags
         self.exception_tags = exception_tags
         self.notags = notags
+        # Tag filters don't change, so they are turned into sets only once
+        self._filter_pairs, self._filter_keys = split_tag_filter(filter_tags)
+        self._exception_pairs, self._exception_keys = split_tag_filter(exception_tags)
+        self._notag_values = freeze_tag_values(notags)
 
     @property
     def get_deleted(self):
@@ -52,29 +58,52 @@ class IP(Service):
         logging.info(f"count of items in deleted_ips: {count}")
         return count
 
+    def _delete_ip(self, ip_name: str) -> None:
+        """
+        Delete a single public IP address.
+
+        :param ip_name: name of the public IP address to delete
+        :type ip_name: str
+        """
+        self.base.get_network_client().public_ip_addresses.begin_delete(
+            resource_group_name=self.base.resource_group,
+            public_ip_address_name=ip_name,
+        )
+        logging.info(f"Deleted IP address: {ip_name}")
+
     def delete(self):
         """
         Delete public IP addresses that match the filter and exception tags.
         """
+        ips_to_delete = []
         ips = self.base.get_network_client().public_ip_addresses.list_all()
 
         for ip in ips:
             filter_tags_match = not self.filter_tags or (
                 ip.tags
-                and any(
-                    key in ip.tags and (not value or ip.tags[key] in value)
-                    for key, value in self.filter_tags.items()
+                and bool(
+                    ip.tags.items() & self._filter_pairs
+                    or ip.tags.keys() & self._filter_keys
                 )
             )
 
-            exception_tags_match = self.exception_tags and any(
-                key in ip.tags and (not value or ip.tags[key] in value)
-                for key, value in self.exception_tags.items()
+            # Untagged IPs can't match exception_tags or notags
+            exception_tags_match = (
+                self.exception_tags
+                and ip.tags
+                and bool(
+                    ip.tags.items() & self._exception_pairs
+                    or ip.tags.keys() & self._exception_keys
+                )
             )
 
-            no_tags_match = self.notags and all(
-                key in ip.tags and (not value or ip.tags[key] in value)
-                for key, value in self.notags.items()
+            no_tags_match = (
+                self.notags
+                and ip.tags
+                and all(
+                    key in ip.tags and (not value or ip.tags[key] in value)
+                    for key, value in self._notag_values.items()
+                )
             )
 
             if (
@@ -83,13 +112,28 @@ class IP(Service):
                 and not no_tags_match
                 and ip.ip_configuration is None
             ):
-                if not self.dry_run:
-                    self.base.get_network_client().public_ip_addresses.begin_delete(
-                        resource_group_name=self.base.resource_group,
-                        public_ip_address_name=ip.name,
-                    )
-                    logging.info(f"Deleted IP address: {ip.name}")
-                self.deleted_ips.append(ip.name)
+                ips_to_delete.append(ip.name)
+
+        if self.dry_run:
+            self.deleted_ips.extend(ips_to_delete)
+        else:
+            # begin_delete only starts the operation, so the calls are issued concurrently
+            with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._delete_ip, ip_name): ip_name
+                    for ip_name in ips_to_delete
+                }
+                for future in as_completed(futures):
+                    ip_name = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logging.error(
+                            f"Error occurred while deleting IP address {ip_name}: {e}"
+                        )
+                        continue
+                    self.deleted_ips.append(ip_name)
+
         if not self.dry_run:
             logging.warning(f"number of Azure IPs deleted: {len(self.deleted_ips)}")
             logging.warning(f"List of Azure IPs deleted: {self.deleted_ips}")
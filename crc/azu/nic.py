@@ -80,7 +80,6 @@ class NIC(Service):
         """
         Deletes the unattached network interface (NIC).
         """
-        all_nics = self.base.get_network_client().network_interfaces.list_all()
         for nic in self.base.get_network_client().network_interfaces.list_all():
             if not nic.virtual_machine:
                 if self._should_delete_nic(nic.name):
@@ -1,8 +1,11 @@
 # Copyright (c) Yugabyte, Inc.
 
+import functools
+
 from google.cloud import compute_v1
 
 
+@functools.lru_cache(maxsize=8)
 def get_gcp_regions(project_id):
     client = compute_v1.RegionsClient()
     project_id = project_id
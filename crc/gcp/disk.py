@@ -1,7 +1,6 @@
 # Copyright (c) Yugabyte, Inc.
 
 import logging
-import re
 from datetime import datetime
 from typing import Dict, List
 
@@ -9,6 +8,7 @@ from google.cloud import compute_v1
 from googleapiclient import discovery
 
 from crc.service import Service
+from crc.utils import compile_regex
 
 
 class Disk(Service):
@@ -80,6 +80,7 @@ class Disk(Service):
         self.notags = notags
         self.name_regex = name_regex
         self.exception_regex = exception_regex
+        self.exception_pattern = compile_regex(exception_regex)
         self.slack_notify_users = slack_notify_users
         self.slack_user_label = slack_user_label
         if self.slack_notify_users:
@@ -147,10 +148,8 @@ class Disk(Service):
         :rtype: bool
         """
         in_exception_labels = False
-        if self.exception_regex:
-            for ex_reg in self.exception_regex:
-                if re.match(r"{}".format(ex_reg), disk.name):
-                    return True
+        if self.exception_pattern and self.exception_pattern.match(disk.name):
+            return True
 
         if self.exception_labels:
             in_exception_labels = any(
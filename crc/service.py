@@ -15,6 +15,9 @@ class Service:
     It also sets up logging for the class.
     """
 
+    # No per-instance state of its own, so subclasses declaring __slots__ don't get a __dict__
+    __slots__ = ()
+
     # Directory where logs will be stored
     logs_dir = "logs"
     # File name of the log file
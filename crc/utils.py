@@ -2,6 +2,8 @@
 
 import logging
 import os
+import re
+from typing import Dict, FrozenSet, List, Match, Optional, Pattern, Tuple, Union
 
 LOG_FORMATTER = (
     "%(asctime)s %(filename)s:%(lineno)d %(levelname)s %(threadName)s %(message)s"
@@ -45,3 +47,126 @@ def init_logging(filename: str, log_level: str = "debug"):
     logging.info(
         f"Logging initialized with file: {filename} and level: {log_level.upper()}"
     )
+
+
+# Backreferences and conditionals refer to groups by number, which shift once patterns are joined
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\\g<|\(\?P=|\(\?\(")
+
+# Flags of a str pattern compiled without any inline flag
+_DEFAULT_FLAGS = re.compile("").flags
+
+
+class PatternList:
+    """
+    Regular expressions which can't be fused into a single alternation, tried one after the other.
+    It offers the search and match methods of a compiled pattern.
+    """
+
+    __slots__ = ("patterns",)
+
+    def __init__(self, patterns: List[Pattern]) -> None:
+        """
+        :param patterns: compiled regular expressions
+        :type patterns: List[Pattern]
+        """
+        self.patterns = patterns
+
+    def search(self, string: str) -> Optional[Match]:
+        """
+        Return the match of the first pattern found anywhere in the string, None if no pattern matches.
+        """
+        for pattern in self.patterns:
+            found = pattern.search(string)
+            if found:
+                return found
+        return None
+
+    def match(self, string: str) -> Optional[Match]:
+        """
+        Return the match of the first pattern matching at the beginning of the string, None if no pattern matches.
+        """
+        for pattern in self.patterns:
+            found = pattern.match(string)
+            if found:
+                return found
+        return None
+
+
+def _can_fuse(pattern: str, compiled: Pattern) -> bool:
+    """
+    Check if a regular expression keeps its meaning once joined with others into an alternation.
+    Inline global flags such as (?i) must start the whole expression, numbered references shift
+    and named groups may clash with the ones of another pattern.
+
+    :param pattern: regular expression
+    :type pattern: str
+    :param compiled: the compiled regular expression
+    :type compiled: Pattern
+    :return: True if the pattern can be fused, False otherwise
+    :rtype: bool
+    """
+    return (
+        compiled.flags == _DEFAULT_FLAGS
+        and not compiled.groupindex
+        and not _GROUP_REFERENCE.search(pattern)
+    )
+
+
+def compile_regex(
+    patterns: Optional[List[str]],
+) -> Optional[Union[Pattern, PatternList]]:
+    """
+    Compile a list of regular expressions into a single matcher
+
+    Patterns are fused into a single alternation when that keeps their meaning, so matching a name
+    is a single call into the re engine instead of one call per pattern. Otherwise each pattern is
+    compiled on its own and they are tried one after the other.
+
+    :param patterns: list of regular expressions, may be empty or None
+    :type patterns: Optional[List[str]]
+    :return: matcher for any of the given expressions, None if no patterns were given
+    :rtype: Optional[Union[Pattern, PatternList]]
+    :raises re.error: if one of the patterns is not a valid regular expression
+    """
+    if not patterns:
+        return None
+    compiled = [re.compile(pattern) for pattern in patterns]
+    if len(compiled) == 1:
+        return compiled[0]
+    if all(_can_fuse(pattern, c) for pattern, c in zip(patterns, compiled)):
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+    return PatternList(compiled)
+
+
+def split_tag_filter(
+    tags: Optional[Dict[str, List[str]]],
+) -> Tuple[FrozenSet[Tuple[str, str]], FrozenSet[str]]:
+    """
+    Split a tag filter into the set of (key, value) pairs it matches and the set of keys matching any value
+
+    A resource's tags can then be matched against the filter with two set intersections.
+
+    :param tags: tag filter, an empty list of values means any value of the key matches
+    :type tags: Optional[Dict[str, List[str]]]
+    :return: (key, value) pairs and keys matching any value
+    :rtype: Tuple[FrozenSet[Tuple[str, str]], FrozenSet[str]]
+    """
+    if not tags:
+        return frozenset(), frozenset()
+    pairs = frozenset((key, value) for key, values in tags.items() for value in values)
+    any_value_keys = frozenset(key for key, values in tags.items() if not values)
+    return pairs, any_value_keys
+
+
+def freeze_tag_values(
+    tags: Optional[Dict[str, List[str]]],
+) -> Dict[str, FrozenSet[str]]:
+    """
+    Turn the lists of values of a tag filter into sets, for constant time membership tests
+
+    :param tags: tag filter, an empty list of values means any value of the key matches
+    :type tags: Optional[Dict[str, List[str]]]
+    :return: tag filter with the values as sets, an empty set still means any value
+    :rtype: Dict[str, FrozenSet[str]]
+    """
+    return {key: frozenset(values or ()) for key, values in (tags or {}).items()}
@@ -0,0 +1 @@
+# Copyright (c) Yugabyte, Inc.
@@ -0,0 +1,174 @@
+# Copyright (c) Yugabyte, Inc.
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from crc.aws import _base
+
+
+class TestRegionsCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.tmpdir.name, "crc", "regions.json")
+        patcher = mock.patch.object(_base, "REGIONS_CACHE_FILE", self.cache_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_missing_file(self):
+        self.assertIsNone(_base._read_cached_regions("111:aws", "ec2"))
+
+    def test_hit(self):
+        _base._write_cached_regions("111:aws", "ec2", ["us-west-2", "eu-west-1"])
+        self.assertEqual(
+            _base._read_cached_regions("111:aws", "ec2"), ["us-west-2", "eu-west-1"]
+        )
+
+    def test_entries_are_kept_per_account_partition_and_service(self):
+        _base._write_cached_regions("111:aws", "ec2", ["us-west-2"])
+        _base._write_cached_regions("111:aws", "kms", ["us-east-1"])
+        _base._write_cached_regions("222:aws-cn", "ec2", ["cn-north-1"])
+        self.assertEqual(_base._read_cached_regions("111:aws", "ec2"), ["us-west-2"])
+        self.assertEqual(_base._read_cached_regions("111:aws", "kms"), ["us-east-1"])
+        self.assertEqual(
+            _base._read_cached_regions("222:aws-cn", "ec2"), ["cn-north-1"]
+        )
+        self.assertIsNone(_base._read_cached_regions("333:aws", "ec2"))
+        self.assertIsNone(_base._read_cached_regions("222:aws-cn", "kms"))
+
+    def test_expired(self):
+        _base._write_cached_regions("111:aws", "ec2", ["us-west-2"])
+        expired = time.time() + _base.REGIONS_CACHE_TTL + 1
+        with mock.patch.object(_base.time, "time", return_value=expired):
+            self.assertIsNone(_base._read_cached_regions("111:aws", "ec2"))
+
+    def test_corrupt_file(self):
+        os.makedirs(os.path.dirname(self.cache_file))
+        for content in ("{not json", "[]", '{"111:aws": {"ec2": {}}}'):
+            with open(self.cache_file, "w") as cache_file:
+                cache_file.write(content)
+            self.assertIsNone(_base._read_cached_regions("111:aws", "ec2"))
+
+        # A corrupt file is replaced on the next write
+        _base._write_cached_regions("111:aws", "ec2", ["us-west-2"])
+        self.assertEqual(_base._read_cached_regions("111:aws", "ec2"), ["us-west-2"])
+        with open(self.cache_file) as cache_file:
+            self.assertIn("111:aws", json.load(cache_file))
+
+    def test_get_all_regions_uses_the_account_entry(self):
+        _base._write_cached_regions("111:aws", "ec2", ["us-west-2"])
+        with mock.patch.object(
+            _base, "_get_account_scope", return_value=("111", "aws")
+        ):
+            regions = _base.get_all_regions.__wrapped__("ec2", "us-west-2")
+        self.assertEqual(regions, ["us-west-2"])
+
+    def test_get_all_regions_without_account_uses_the_partition_entry(self):
+        _base._write_cached_regions("aws", "ec2", ["eu-west-1"])
+        with mock.patch.object(_base, "_get_account_scope", return_value=(None, "aws")):
+            regions = _base.get_all_regions.__wrapped__("ec2", "us-west-2")
+        self.assertEqual(regions, ["eu-west-1"])
+
+    def test_get_all_regions_keeps_every_enabled_region(self):
+        client = mock.Mock()
+        client.describe_regions.return_value = {
+            "Regions": [{"RegionName": "us-west-2"}, {"RegionName": "xx-new-1"}]
+        }
+        with mock.patch.object(
+            _base, "_get_account_scope", return_value=("111", "aws")
+        ), mock.patch.object(_base, "get_client", return_value=client):
+            regions = _base.get_all_regions.__wrapped__("ec2", "us-west-2")
+        self.assertEqual(regions, ["us-west-2", "xx-new-1"])
+        client.describe_regions.assert_called_once_with(AllRegions=False)
+        self.assertEqual(
+            _base._read_cached_regions("111:aws", "ec2"), ["us-west-2", "xx-new-1"]
+        )
+
+
+class TestDescribeAll(unittest.TestCase):
+    def make_client(self, pages_for):
+        """
+        Returns a stub EC2 client whose paginator returns pages_for(filters) for each call.
+        """
+        paginator = mock.Mock()
+        paginator.paginate.side_effect = lambda Filters: pages_for(Filters)
+        client = mock.Mock()
+        client.get_paginator.return_value = paginator
+        return client, paginator
+
+    def describe(self, client, filters):
+        return _base.describe_all(
+            client,
+            "describe_addresses",
+            filters,
+            lambda page: page["Addresses"],
+            "AllocationId",
+        )
+
+    def test_few_filters_single_call(self):
+        filters = [{"Name": "domain", "Values": ["vpc"]}] + _base.get_tag_filters(
+            {f"k{i}": ["v"] for i in range(_base.MAX_TAG_FILTERS)}
+        )
+        client, paginator = self.make_client(
+            lambda _: [
+                {"Addresses": [{"AllocationId": "a"}]},
+                {"Addresses": [{"AllocationId": "b"}]},
+            ]
+        )
+        items = self.describe(client, filters)
+        self.assertEqual([item["AllocationId"] for item in items], ["a", "b"])
+        client.get_paginator.assert_called_once_with("describe_addresses")
+        paginator.paginate.assert_called_once_with(Filters=filters)
+
+    def test_many_filters_intersection(self):
+        other = {"Name": "domain", "Values": ["vpc"]}
+        tag_filters = _base.get_tag_filters(
+            {f"k{i}": ["v"] for i in range(_base.MAX_TAG_FILTERS + 3)}
+        )
+        first_group = tag_filters[: _base.MAX_TAG_FILTERS]
+        ids_for_group = {
+            tag_filters[0]["Name"]: ["a", "b", "c"],
+            tag_filters[_base.MAX_TAG_FILTERS]["Name"]: ["b", "c", "d"],
+        }
+
+        def pages_for(filters):
+            self.assertIn(other, filters)
+            self.assertLessEqual(len(filters) - 1, _base.MAX_TAG_FILTERS)
+            ids = ids_for_group[filters[1]["Name"]]
+            return [{"Addresses": [{"AllocationId": i} for i in ids]}]
+
+        client, paginator = self.make_client(pages_for)
+        items = self.describe(client, [other] + tag_filters)
+        self.assertEqual(sorted(item["AllocationId"] for item in items), ["b", "c"])
+        self.assertEqual(paginator.paginate.call_count, 2)
+        self.assertEqual(
+            paginator.paginate.call_args_list[0],
+            mock.call(Filters=[other] + first_group),
+        )
+
+    def test_many_filters_empty_intersection(self):
+        tag_filters = _base.get_tag_filters(
+            {f"k{i}": ["v"] for i in range(_base.MAX_TAG_FILTERS * 2)}
+        )
+        ids_for_group = {
+            tag_filters[0]["Name"]: ["a"],
+            tag_filters[_base.MAX_TAG_FILTERS]["Name"]: ["b"],
+        }
+        client, _ = self.make_client(
+            lambda filters: [
+                {
+                    "Addresses": [
+                        {"AllocationId": i} for i in ids_for_group[filters[0]["Name"]]
+                    ]
+                }
+            ]
+        )
+        self.assertEqual(self.describe(client, tag_filters), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
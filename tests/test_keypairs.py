@@ -0,0 +1,78 @@
+# Copyright (c) Yugabyte, Inc.
+
+import re
+import unittest
+from fnmatch import fnmatchcase
+
+from crc.aws.keypairs import KeyPairs, _regex_to_glob
+
+# Keypair names the translated globs are checked against
+NAMES = [
+    "perftest",
+    "perftest_key",
+    "my_perftest",
+    "my_perftest_key",
+    "qa-perftest.pem",
+    "other",
+]
+
+
+class TestRegexToGlob(unittest.TestCase):
+    def assert_same_matches(self, regex, glob):
+        for name in NAMES:
+            self.assertEqual(
+                bool(re.search(regex, name)), fnmatchcase(name, glob), (regex, name)
+            )
+
+    def test_unanchored(self):
+        self.assertEqual(_regex_to_glob("perftest"), "*perftest*")
+        self.assert_same_matches("perftest", "*perftest*")
+
+    def test_anchored(self):
+        self.assertEqual(_regex_to_glob("^perftest"), "perftest*")
+        self.assertEqual(_regex_to_glob("perftest$"), "*perftest")
+        self.assertEqual(_regex_to_glob("^perftest$"), "perftest")
+        for regex in ("^perftest", "perftest$", "^perftest$"):
+            self.assert_same_matches(regex, _regex_to_glob(regex))
+
+    def test_characters_without_regex_meaning(self):
+        self.assertEqual(_regex_to_glob("^qa-perftest"), "qa-perftest*")
+        self.assert_same_matches("^qa-perftest", "qa-perftest*")
+
+    def test_special_characters_are_not_translated(self):
+        for regex in (
+            "perftest.pem",
+            "perftest_.*",
+            "^perf(test)?",
+            "perf[a-z]+",
+            "a|b",
+            r"perftest\.pem",
+            "perftest*",
+        ):
+            self.assertIsNone(_regex_to_glob(regex), regex)
+
+    def test_empty_pattern_is_not_translated(self):
+        for regex in ("", "^", "$", "^$"):
+            self.assertIsNone(_regex_to_glob(regex), regex)
+
+
+class TestKeyPairsFilter(unittest.TestCase):
+    def get_filter(self, name_regex):
+        return KeyPairs(False, name_regex, [], {"days": 1})._get_filter()
+
+    def test_plain_patterns(self):
+        self.assertEqual(
+            self.get_filter(["^perftest", "qa"]),
+            [{"Name": "key-name", "Values": ["perftest*", "*qa*"]}],
+        )
+
+    def test_falls_back_when_a_pattern_cannot_be_translated(self):
+        self.assertEqual(self.get_filter(["^perftest", "qa.*"]), [])
+
+    def test_no_patterns(self):
+        self.assertEqual(self.get_filter([]), [])
+        self.assertEqual(self.get_filter(None), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+# Copyright (c) Yugabyte, Inc.
+
+import re
+import unittest
+
+from crc.utils import PatternList, compile_regex
+
+
+class TestCompileRegex(unittest.TestCase):
+    def test_no_patterns(self):
+        self.assertIsNone(compile_regex(None))
+        self.assertIsNone(compile_regex([]))
+
+    def test_single_pattern_is_compiled_as_is(self):
+        pattern = compile_regex(["(?i)^perftest_"])
+        self.assertIsInstance(pattern, re.Pattern)
+        self.assertTrue(pattern.search("PERFTEST_key"))
+
+    def test_plain_patterns_are_fused(self):
+        pattern = compile_regex(["perftest_", "^qa_"])
+        self.assertIsInstance(pattern, re.Pattern)
+        self.assertTrue(pattern.search("my_perftest_key"))
+        self.assertTrue(pattern.search("qa_key"))
+        self.assertFalse(pattern.search("my_qa_key"))
+
+    def test_inline_flags_are_not_fused(self):
+        pattern = compile_regex(["foo", "(?i)bar"])
+        self.assertIsInstance(pattern, PatternList)
+        self.assertTrue(pattern.search("xBARx"))
+        self.assertTrue(pattern.search("foo"))
+        self.assertFalse(pattern.search("FOO"))
+
+    def test_backreferences_keep_their_group(self):
+        pattern = compile_regex(["(a)b", r"(c)\1"])
+        self.assertIsInstance(pattern, PatternList)
+        self.assertTrue(pattern.search("cc"))
+        self.assertFalse(pattern.search("ca"))
+
+    def test_duplicate_named_groups(self):
+        pattern = compile_regex(["(?P<env>dev)_", "(?P<env>qa)_"])
+        self.assertIsInstance(pattern, PatternList)
+        self.assertTrue(pattern.search("qa_key"))
+
+    def test_match_is_anchored_at_the_start(self):
+        pattern = compile_regex(["keep", r"(x)\1"])
+        self.assertTrue(pattern.match("keep_me"))
+        self.assertFalse(pattern.match("do_not_keep"))
+
+    def test_invalid_pattern_raises(self):
+        with self.assertRaises(re.error):
+            compile_regex(["valid", "vm(1"])
+
+
+if __name__ == "__main__":
+    unittest.main()